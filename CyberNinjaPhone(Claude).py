@@ -1,30 +1,39 @@
 import sys
+import atexit
+import asyncio
 import subprocess
 import os
 import json
+import hashlib
 import time
 import socket
 import threading
 import platform
+import functools
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, Dict, List, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from enum import Enum
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
-    QCheckBox, QLineEdit, QFileDialog, QTextEdit, QComboBox, QGroupBox, 
-    QDialog, QTableWidget, QTableWidgetItem, QInputDialog, QMessageBox,
+    QCheckBox, QLineEdit, QFileDialog, QTextEdit, QPlainTextEdit, QComboBox, QGroupBox, 
+    QDialog, QTableView, QInputDialog, QMessageBox,
     QSpinBox, QSlider, QTabWidget, QListWidget, QSplitter, QMenu,
-    QSystemTrayIcon, QAction
+    QSystemTrayIcon, QAction, QGraphicsDropShadowEffect
 )
-from PyQt5.QtGui import QFont, QMovie, QIcon, QPixmap, QTextCursor
+from PyQt5.QtGui import QFont, QMovie, QIcon, QPixmap, QColor
 from PyQt5.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, 
-    pyqtSignal, pyqtSlot, QThread, QMutex, QMutexLocker
+    Qt, QTimer, QPropertyAnimation, QParallelAnimationGroup, QEasingCurve,
+    pyqtSignal, pyqtSlot, QThread, QObject, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex
 )
 
 # Configuration constants
@@ -35,10 +44,202 @@ LOG_FILE = "cyberphone_log.txt"
 DEFAULT_BITRATE = "8M"
 DEFAULT_MAX_SIZE = "1440"
 DEFAULT_FPS = 60
+DEFAULT_IP_BASE = "192.168.1"
 SCAN_TIMEOUT = 0.1
+SCAN_CONFIRM_WORKERS = 16
 RECONNECT_INTERVAL = 10
 MAX_RECONNECT_ATTEMPTS = 3
 ADB_TIMEOUT = 5
+ADB_WORKERS = 8
+LOG_FLUSH_INTERVAL = 100  # ms
+LOG_MAX_LINES = 5000
+PROGRESS_INTERVAL = 50  # ms
+REAP_INTERVAL = 2000  # ms
+SCRCPY_STOP_GRACE = 1  # seconds before a terminated scrcpy is killed
+ADB_SERVER = ("127.0.0.1", 5037)
+EXE_FILTER = "Executable (*.exe)" if platform.system() == "Windows" else "All Files (*)"
+
+# Run scrcpy in its own session/process group so it outlives a crashed UI
+if os.name == "nt":
+    SCRCPY_POPEN_ARGS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    SCRCPY_POPEN_ARGS = {"start_new_session": True}
+
+# Stylesheets
+MAIN_STYLE = """
+    QWidget {
+        background-color: #000814;
+        color: #00c8ff;
+        font-family: 'Consolas', 'Monaco', monospace;
+    }
+    QGroupBox {
+        border: 2px solid #00c8ff;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #00ffff;
+    }
+    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox {
+        background-color: #001f3f;
+        color: #00c8ff;
+        border: 1px solid #00c8ff;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #00c8ff;
+        background-color: #000814;
+    }
+    QTabBar::tab {
+        background-color: #001f3f;
+        color: #00c8ff;
+        padding: 8px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #003366;
+        border-bottom: 2px solid #00ffff;
+    }
+"""
+
+TITLE_STYLE = """
+    font-size: 20px;
+    font-weight: bold;
+    color: #00ffff;
+    padding: 10px;
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #001f3f, stop:0.5 #003366, stop:1 #001f3f);
+    border-radius: 5px;
+"""
+
+LOG_STYLE = """
+    background-color: #000000;
+    color: #00ff00;
+    font-family: monospace;
+    font-size: 12px;
+    border: 1px solid #00ff00;
+"""
+
+STATUS_STYLE = """
+    background-color: #001f3f;
+    color: #00ffff;
+    padding: 5px;
+    border: 1px solid #00c8ff;
+    border-radius: 3px;
+"""
+
+TERMINAL_STYLE = """
+    background-color: #000000;
+    color: #00ff00;
+    font-family: monospace;
+"""
+
+DIALOG_STYLE = """
+    QDialog {
+        background-color: #000814;
+        color: #00c8ff;
+    }
+    QTableView {
+        background-color: #001f3f;
+        color: #00c8ff;
+        border: 1px solid #00c8ff;
+        gridline-color: #003366;
+    }
+    QHeaderView::section {
+        background-color: #002244;
+        color: #00c8ff;
+        padding: 5px;
+        border: 1px solid #00c8ff;
+    }
+"""
+
+BUTTON_STYLE = """
+    QPushButton {
+        background-color: #001f3f;
+        color: #00c8ff;
+        border: 2px solid #00c8ff;
+        border-radius: 5px;
+        padding: 8px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #003366;
+        border: 2px solid #00ffff;
+    }
+    QPushButton:pressed {
+        background-color: #004477;
+    }
+"""
+
+def adb_request(command: str) -> bytes:
+    """Frame a command for the ADB server's host protocol"""
+    data = command.encode()
+    return b"%04x" % len(data) + data
+
+def make_device_id(ip: str, port: int) -> str:
+    """Build the adb serial of a wireless device"""
+    return f"{ip}:{port}"
+
+def parse_adb_devices(output: str) -> Dict[str, str]:
+    """Map device ids to their state from the output of adb devices"""
+    states = {}
+    lines = iter(output.splitlines())
+    next(lines, None)  # "List of devices attached"
+    for line in lines:
+        device_id, sep, state = line.partition("\t")
+        if sep:
+            states[device_id] = state
+    return states
+
+def read_json(path):
+    """Load a JSON file, using orjson when it is installed"""
+    if orjson:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def dump_json(data) -> bytes:
+    """Serialize data as indented UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def write_file_atomic(path, data: bytes):
+    """Write a file via a temporary sibling so a crash never leaves it truncated"""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def format_timestamp(ts: Optional[float]) -> str:
+    """Format an epoch timestamp as YYYY-MM-DD HH:MM:SS without going through strftime"""
+    if ts is None:
+        return "Never"
+    t = time.localtime(ts)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+            f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+
+def with_slots(*extra: str):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)"""
+    def wrap(cls):
+        names = tuple(f.name for f in fields(cls))
+        namespace = dict(cls.__dict__)
+        namespace["__slots__"] = names + extra
+        # Field defaults live in the generated __init__, not on the class
+        for name in names:
+            namespace.pop(name, None)
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+    return wrap
 
 class DeviceStatus(Enum):
     """Device connection status enumeration"""
@@ -54,6 +255,7 @@ class ConnectionMode(Enum):
     WIRELESS = "wireless"
     UNKNOWN = "unknown"
 
+@with_slots("_last_seen_text")
 @dataclass
 class Device:
     """Device information dataclass"""
@@ -63,9 +265,26 @@ class Device:
     mode: ConnectionMode = ConnectionMode.UNKNOWN
     ip: str = ""
     port: int = 5555
-    last_seen: Optional[datetime] = None
+    last_seen: Optional[float] = None  # time.time() when last seen
     properties: Dict = field(default_factory=dict)
+    
+    @property
+    def status_text(self) -> str:
+        return self.status.value
+    
+    @property
+    def mode_text(self) -> str:
+        return self.mode.value
+    
+    @property
+    def last_seen_text(self) -> str:
+        # Formatted once per last_seen value rather than on every table repaint
+        cached = getattr(self, "_last_seen_text", None)
+        if cached is None or cached[0] != self.last_seen:
+            cached = self._last_seen_text = (self.last_seen, format_timestamp(self.last_seen))
+        return cached[1]
 
+@with_slots()
 @dataclass
 class Profile:
     """Scrcpy configuration profile"""
@@ -81,12 +300,16 @@ class Profile:
     custom_options: str = ""
 
 class NetworkScanner(QThread):
-    """Threaded network scanner for device discovery"""
-    device_found = pyqtSignal(str, str)  # ip, port
+    """Threaded network scanner for device discovery
+    
+    The thread only owns an asyncio event loop; every probe runs as a
+    coroutine on that loop, so the GUI thread never waits on the network.
+    """
+    device_found = pyqtSignal(str, int)  # ip, port
     scan_complete = pyqtSignal(list)  # List of found devices
     progress = pyqtSignal(int)  # Progress percentage
     
-    def __init__(self, ip_base: str = "192.168.1", port: int = 5555):
+    def __init__(self, ip_base: str = DEFAULT_IP_BASE, port: int = 5555):
         super().__init__()
         self.ip_base = ip_base
         self.port = port
@@ -94,35 +317,107 @@ class NetworkScanner(QThread):
         
     def run(self):
         """Scan network for ADB devices"""
-        found_devices = []
-        for i in range(1, 255):
+        loop = asyncio.new_event_loop()
+        try:
+            found_devices = loop.run_until_complete(self.scan())
+        finally:
+            loop.close()
+        self.scan_complete.emit(found_devices)
+        
+    async def scan(self):
+        """Probe every host of the /24 concurrently"""
+        self._probed = 0
+        self._percent = -1
+        self._confirms = []
+        self._confirm_slots = asyncio.Semaphore(SCAN_CONFIRM_WORKERS)
+        await asyncio.gather(*[self.probe(f"{self.ip_base}.{i}") for i in range(1, 255)])
+        results = await asyncio.gather(*self._confirms)
+        return [device for device in results if device]
+        
+    async def probe(self, ip):
+        """Check a single host for an open ADB port"""
+        try:
             if self.stop_scan:
-                break
+                return
                 
-            ip = f"{self.ip_base}.{i}"
-            self.progress.emit(int((i / 254) * 100))
-            
+            # A bare non-blocking connect on the loop's selector; no stream
+            # transport is needed just to see whether the port answers
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(SCAN_TIMEOUT)
-                result = sock.connect_ex((ip, self.port))
+                await asyncio.wait_for(
+                    asyncio.get_running_loop().sock_connect(sock, (ip, self.port)),
+                    timeout=SCAN_TIMEOUT
+                )
+            except Exception:
+                return
+            finally:
                 sock.close()
                 
-                if result == 0:
-                    # Try ADB connection
-                    try:
-                        cmd = ["adb", "connect", f"{ip}:{self.port}"]
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
-                        
-                        if "connected" in result.stdout.lower():
-                            found_devices.append((ip, str(self.port)))
-                            self.device_found.emit(ip, str(self.port))
-                    except Exception:
-                        pass
+            # Confirm separately so a slow adb reply never holds up probing
+            self._confirms.append(asyncio.ensure_future(self.confirm(ip)))
+        finally:
+            self._probed += 1
+            percent = int((self._probed / 254) * 100)
+            # Only cross to the GUI thread when the visible value changes
+            if percent != self._percent:
+                self._percent = percent
+                self.progress.emit(percent)
+            
+    async def confirm(self, ip):
+        """Try an ADB connection to a host with an open port"""
+        async with self._confirm_slots:
+            if self.stop_scan:
+                return None
+                
+            try:
+                if await self.adb_connect(ip):
+                    self.device_found.emit(ip, self.port)
+                    return (ip, self.port)
             except Exception:
                 pass
+            return None
+            
+    async def adb_connect(self, ip):
+        """Ask the ADB server to connect to a device over its host socket"""
+        serial = make_device_id(ip, self.port)
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(*ADB_SERVER),
+                timeout=2
+            )
+        except (OSError, asyncio.TimeoutError):
+            # Server not up yet: the adb client will start it for us
+            return await self.adb_connect_client(serial)
+            
+        try:
+            writer.write(adb_request(f"host:connect:{serial}"))
+            await writer.drain()
+            
+            async def read_reply():
+                status = await reader.readexactly(4)
+                length = int(await reader.readexactly(4), 16)
+                return status, await reader.readexactly(length)
                 
-        self.scan_complete.emit(found_devices)
+            status, message = await asyncio.wait_for(read_reply(), timeout=2)
+            return status == b"OKAY" and b"connected" in message
+        finally:
+            writer.close()
+            
+    async def adb_connect_client(self, serial):
+        """Connect through the adb command line client"""
+        process = await asyncio.create_subprocess_exec(
+            "adb", "connect", serial,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=2)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return False
+        return b"connected" in stdout
         
     def stop(self):
         """Stop the network scan"""
@@ -137,122 +432,237 @@ class DeviceMonitor(QThread):
     
     def __init__(self):
         super().__init__()
-        self.monitoring = True
+        self.stop_event = threading.Event()
         self.devices = {}
-        self.mutex = QMutex()
+        self.sock = None
         
     def run(self):
         """Monitor device status continuously"""
-        while self.monitoring:
+        while not self.stop_event.is_set():
             try:
-                result = subprocess.run(
-                    ["adb", "devices"], 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=ADB_TIMEOUT
-                )
+                self.trackDevices()
+            except Exception as e:
+                if not self.stop_event.is_set():
+                    print(f"Device monitor error: {e}")
+                    
+            if not self.stop_event.is_set():
+                # Server is down or restarted: bring it back before reattaching
+                try:
+                    subprocess.run(
+                        ["adb", "start-server"],
+                        capture_output=True,
+                        timeout=ADB_TIMEOUT
+                    )
+                except Exception:
+                    pass
+                if self.stop_event.wait(2):
+                    break
                 
-                current_devices = {}
-                for line in result.stdout.splitlines()[1:]:
-                    if "\t" in line:
-                        device_id, status = line.split("\t")
-                        current_devices[device_id] = status
+    def trackDevices(self):
+        """Follow the ADB server's host:track-devices push stream"""
+        with socket.create_connection(ADB_SERVER, timeout=ADB_TIMEOUT) as sock:
+            self.sock = sock
+            sock.sendall(adb_request("host:track-devices"))
+            if self.recvExactly(sock, 4) != b"OKAY":
+                raise ConnectionError("ADB server refused track-devices")
                 
-                with QMutexLocker(self.mutex):
-                    # Check for new devices
-                    for device_id, status in current_devices.items():
-                        if device_id not in self.devices:
-                            self.device_connected.emit(device_id)
-                        elif self.devices[device_id] != status:
-                            self.status_changed.emit(device_id, status)
-                    
-                    # Check for disconnected devices
-                    for device_id in self.devices:
-                        if device_id not in current_devices:
-                            self.device_disconnected.emit(device_id)
-                    
-                    self.devices = current_devices
-                    
-            except Exception as e:
-                print(f"Device monitor error: {e}")
+            # The server only writes when the device list changes
+            sock.settimeout(None)
+            while not self.stop_event.is_set():
+                length = int(self.recvExactly(sock, 4), 16)
+                payload = self.recvExactly(sock, length).decode(errors="replace")
+                
+                current_devices = {}
+                for line in payload.split("\n"):
+                    device_id, sep, status = line.partition("\t")
+                    if sep:
+                        current_devices[device_id] = status.strip()
+                        
+                self.updateDevices(current_devices)
                 
-            time.sleep(2)
+    @staticmethod
+    def recvExactly(sock, size):
+        """Read exactly size bytes from the socket"""
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("ADB server closed the connection")
+            data += chunk
+        return data
+        
+    def updateDevices(self, current_devices):
+        """Diff a new device list against the last one and emit changes"""
+        # Readers only ever see a whole snapshot, so swapping the reference
+        # at the end is enough - no lock needed
+        previous = self.devices
+        
+        # Check for new devices
+        for device_id, status in current_devices.items():
+            if device_id not in previous:
+                self.device_connected.emit(device_id)
+            elif previous[device_id] != status:
+                self.status_changed.emit(device_id, status)
+        
+        # Check for disconnected devices
+        for device_id in previous:
+            if device_id not in current_devices:
+                self.device_disconnected.emit(device_id)
+        
+        self.devices = current_devices
     
     def stop(self):
         """Stop monitoring"""
-        self.monitoring = False
+        self.stop_event.set()
+        if self.sock:
+            # Wake the blocking recv in trackDevices
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
         self.wait()
 
+class AdbTaskSignals(QObject):
+    """Signals emitted by an AdbTask"""
+    finished = pyqtSignal(object)  # subprocess.CompletedProcess
+    failed = pyqtSignal(str)  # Error message
+
+class AdbTask(QRunnable):
+    """Run a single adb command on the thread pool"""
+    def __init__(self, args: List[str]):
+        super().__init__()
+        self.args = args
+        self.signals = AdbTaskSignals()
+        
+    def run(self):
+        """Execute the command and report the result"""
+        try:
+            result = subprocess.run(
+                self.args,
+                capture_output=True,
+                text=True,
+                timeout=ADB_TIMEOUT
+            )
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
 class AnimatedButton(QPushButton):
     """Custom animated button with hover effects"""
+    GLOW_OFF = QColor(0, 200, 255, 0)
+    GLOW_ON = QColor(0, 255, 255, 200)
+    GLOW_BLUR = 20
+    
     def __init__(self, text: str, icon: str = None):
         super().__init__(text)
         self._animation = None
-        self._glow = 0
         if icon:
             self.setText(f"{icon} {text}")
+        self.setStyleSheet(BUTTON_STYLE)
+        self._shadow = QGraphicsDropShadowEffect(self)
+        self._shadow.setOffset(0)
+        self._shadow.setBlurRadius(0)
+        self._shadow.setColor(self.GLOW_OFF)
+        self.setGraphicsEffect(self._shadow)
         self.setupAnimation()
-        self.updateStyle()
         
     def setupAnimation(self):
         """Setup hover animation"""
-        self._animation = QPropertyAnimation(self, b"glow")
-        self._animation.setDuration(200)
-        self._animation.setEasingCurve(QEasingCurve.InOutQuad)
-        
-    @pyqtProperty(int)
-    def glow(self):
-        return self._glow
-        
-    @glow.setter
-    def glow(self, value):
-        self._glow = value
-        self.updateStyle()
-        
-    def updateStyle(self):
-    #"""Update button style based on glow value"""
-     glow_color = f"rgba(0, 200, 255, {self._glow})"
-     self.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #001f3f;
-            color: #00c8ff;
-            border: 2px solid #00c8ff;
-            border-radius: 5px;
-            padding: 8px;
-            font-weight: bold;
-        }}
-        QPushButton:hover {{
-            background-color: #003366;
-            border: 2px solid #00ffff;
-            border-color: {glow_color};
-            border-width: {max(2, self._glow//10)}px;
-        }}
-        QPushButton:pressed {{
-            background-color: #004477;
-        }}
-    """)
+        # Animate the effect's native properties so ticks never call into Python
+        self._color_animation = QPropertyAnimation(self._shadow, b"color")
+        self._blur_animation = QPropertyAnimation(self._shadow, b"blurRadius")
+        self._animation = QParallelAnimationGroup(self)
+        for animation in (self._color_animation, self._blur_animation):
+            animation.setDuration(200)
+            animation.setEasingCurve(QEasingCurve.InOutQuad)
+            self._animation.addAnimation(animation)
+            
+    def animateGlow(self, color, blur):
+        """Fade the glow from its current state to the given one"""
+        self._animation.stop()
+        self._color_animation.setStartValue(self._shadow.color())
+        self._color_animation.setEndValue(color)
+        self._blur_animation.setStartValue(self._shadow.blurRadius())
+        self._blur_animation.setEndValue(float(blur))
+        self._animation.start()
         
     def enterEvent(self, event):
         """Handle mouse enter"""
         if self._animation:
-            self._animation.setStartValue(0)
-            self._animation.setEndValue(20)
-            self._animation.start()
+            self.animateGlow(self.GLOW_ON, self.GLOW_BLUR)
         super().enterEvent(event)
         
     def leaveEvent(self, event):
         """Handle mouse leave"""
         if self._animation:
-            self._animation.setStartValue(self._glow)
-            self._animation.setEndValue(0)
-            self._animation.start()
+            self.animateGlow(self.GLOW_OFF, 0)
         super().leaveEvent(event)
 
+class DeviceTableModel(QAbstractTableModel):
+    """Table model backed by the device dictionary"""
+    HEADERS = ["Device ID", "Name", "Status", "Mode", "Last Seen"]
+    STATUS_COLORS = {
+        DeviceStatus.ONLINE: QColor(Qt.green),
+        DeviceStatus.OFFLINE: QColor(Qt.red)
+    }
+    
+    def __init__(self, devices: Dict[str, Device], parent=None):
+        super().__init__(parent)
+        self.devices = devices
+        self._rows = list(devices.values())
+        
+    def refresh(self):
+        """Reload rows from the device dictionary"""
+        self.beginResetModel()
+        self._rows = list(self.devices.values())
+        self.endResetModel()
+        
+    def deviceAt(self, row: int) -> Device:
+        """Return the device shown in the given row"""
+        return self._rows[row]
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        device = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return device.id
+            if column == 1:
+                return device.name
+            if column == 2:
+                return device.status_text
+            if column == 3:
+                return device.mode_text
+            return device.last_seen_text
+            
+        # Color code based on status
+        if role == Qt.ForegroundRole and column == 2:
+            return self.STATUS_COLORS.get(device.status, QColor(Qt.yellow))
+            
+        return None
+
 class DeviceManagerDialog(QDialog):
     """Enhanced device management dialog"""
     def __init__(self, parent, devices: Dict[str, Device]):
         super().__init__(parent)
         self.devices = devices
+        self.selected_device_id = None
         self.initUI()
         
     def initUI(self):
@@ -262,35 +672,17 @@ class DeviceManagerDialog(QDialog):
         self.setMinimumSize(600, 400)
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #000814;
-                color: #00c8ff;
-            }
-            QTableWidget {
-                background-color: #001f3f;
-                color: #00c8ff;
-                border: 1px solid #00c8ff;
-                gridline-color: #003366;
-            }
-            QHeaderView::section {
-                background-color: #002244;
-                color: #00c8ff;
-                padding: 5px;
-                border: 1px solid #00c8ff;
-            }
-        """)
+        self.setStyleSheet(DIALOG_STYLE)
         
         layout = QVBoxLayout()
         
         # Device table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "Device ID", "Name", "Status", "Mode", "Last Seen"
-        ])
+        self.model = DeviceTableModel(self.devices, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.selectionModel().currentRowChanged.connect(self.onCurrentRowChanged)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.showContextMenu)
         
@@ -325,25 +717,12 @@ class DeviceManagerDialog(QDialog):
         
     def updateTable(self):
         """Update the device table"""
-        self.table.setRowCount(len(self.devices))
-        
-        for row, (device_id, device) in enumerate(self.devices.items()):
-            self.table.setItem(row, 0, QTableWidgetItem(device.id))
-            self.table.setItem(row, 1, QTableWidgetItem(device.name))
-            self.table.setItem(row, 2, QTableWidgetItem(device.status.value))
-            self.table.setItem(row, 3, QTableWidgetItem(device.mode.value))
-            
-            last_seen = device.last_seen.strftime("%Y-%m-%d %H:%M:%S") if device.last_seen else "Never"
-            self.table.setItem(row, 4, QTableWidgetItem(last_seen))
-            
-            # Color code based on status
-            status_item = self.table.item(row, 2)
-            if device.status == DeviceStatus.ONLINE:
-                status_item.setForeground(Qt.green)
-            elif device.status == DeviceStatus.OFFLINE:
-                status_item.setForeground(Qt.red)
-            else:
-                status_item.setForeground(Qt.yellow)
+        self.model.refresh()
+        self.selected_device_id = None
+        
+    def onCurrentRowChanged(self, current, previous):
+        """Remember which device the current row shows"""
+        self.selected_device_id = self.model.deviceAt(current.row()).id if current.isValid() else None
                 
     def showContextMenu(self, position):
         """Show context menu for device actions"""
@@ -366,9 +745,8 @@ class DeviceManagerDialog(QDialog):
         
     def refreshDevices(self):
         """Refresh device list"""
-        # Trigger parent's device update
+        # Trigger parent's device update; the table refreshes when it lands
         self.parent().updateDeviceList()
-        self.updateTable()
         
     def addDevice(self):
         """Add a new device manually"""
@@ -391,9 +769,8 @@ class DeviceManagerDialog(QDialog):
             
     def editDevice(self):
         """Edit selected device"""
-        row = self.table.currentRow()
-        if row >= 0:
-            device_id = self.table.item(row, 0).text()
+        device_id = self.selected_device_id
+        if device_id:
             device = self.devices.get(device_id)
             
             if device:
@@ -407,9 +784,8 @@ class DeviceManagerDialog(QDialog):
                     
     def deleteDevice(self):
         """Delete selected device"""
-        row = self.table.currentRow()
-        if row >= 0:
-            device_id = self.table.item(row, 0).text()
+        device_id = self.selected_device_id
+        if device_id:
             
             reply = QMessageBox.question(
                 self, "Confirm Delete",
@@ -423,27 +799,24 @@ class DeviceManagerDialog(QDialog):
                 
     def connectDevice(self):
         """Connect to selected device"""
-        row = self.table.currentRow()
-        if row >= 0:
-            device_id = self.table.item(row, 0).text()
+        device_id = self.selected_device_id
+        if device_id:
             self.parent().connectToDevice(device_id)
             
     def disconnectDevice(self):
         """Disconnect from selected device"""
-        row = self.table.currentRow()
-        if row >= 0:
-            device_id = self.table.item(row, 0).text()
+        device_id = self.selected_device_id
+        if device_id:
             self.parent().disconnectFromDevice(device_id)
             
     def showProperties(self):
         """Show device properties"""
-        row = self.table.currentRow()
-        if row >= 0:
-            device_id = self.table.item(row, 0).text()
+        device_id = self.selected_device_id
+        if device_id:
             device = self.devices.get(device_id)
             
             if device:
-                props = json.dumps(device.properties, indent=2)
+                props = dump_json(device.properties).decode("utf-8")
                 QMessageBox.information(
                     self, f"Device Properties - {device_id}",
                     props
@@ -457,17 +830,20 @@ class DeviceManagerDialog(QDialog):
         )
         
         if filename:
-            export_data = {}
-            for device_id, device in self.devices.items():
-                export_data[device_id] = {
-                    "name": device.name,
-                    "status": device.status.value,
-                    "mode": device.mode.value,
-                    "properties": device.properties
-                }
-                
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # Write one device at a time rather than building the whole export
+            with open(filename, 'wb') as f:
+                f.write(b"{")
+                separator = b"\n"
+                for device_id, device in self.devices.items():
+                    entry = dump_json({
+                        "name": device.name,
+                        "status": device.status_text,
+                        "mode": device.mode_text,
+                        "properties": device.properties
+                    }).replace(b"\n", b"\n  ")
+                    f.write(b"%s  %s: %s" % (separator, json.dumps(device_id).encode("utf-8"), entry))
+                    separator = b",\n"
+                f.write(b"\n}" if self.devices else b"}")
                 
             QMessageBox.information(
                 self, "Export Complete",
@@ -481,65 +857,46 @@ class CyberPhoneNinja(QWidget):
     device_list_updated = pyqtSignal()
     log_message = pyqtSignal(str)
     
+    MONITOR_MESSAGES = {
+        "connected": "Device connected: {}",
+        "disconnected": "Device disconnected: {}",
+        "status_changed": "Device {} status: {}",
+    }
+    
     def __init__(self):
         super().__init__()
         self.devices = {}
         self.profiles = {}
         self.current_profile = None
         self.scrcpy_processes = {}
+        self.stopping_processes = []  # (process, kill deadline) left for the reaper
         self.network_scanner = None
         self.device_monitor = None
+        self.adb_pool = QThreadPool.globalInstance()
+        self.adb_pool.setMaxThreadCount(ADB_WORKERS)
+        self.log_file = self.openLogFile()
+        self.log_stamp = (None, "")  # (epoch second, formatted HH:MM:SS)
+        self.scrcpy_options = None  # Cached scrcpy argv, rebuilt when settings change
+        self.device_combo_state = None  # Device entries the combo box was last built from
+        self.saved_digests = {}  # path -> digest of the JSON last written there
         
         self.initUI()
         self.loadConfiguration()
         self.startMonitoring()
         
+        # Forget scrcpy processes whose windows were closed outside the app
+        self.reap_timer = QTimer(self)
+        self.reap_timer.setInterval(REAP_INTERVAL)
+        self.reap_timer.timeout.connect(self.reapScrcpyProcesses)
+        self.reap_timer.start()
+        
     def initUI(self):
         """Initialize the user interface"""
         self.setWindowTitle("🥷 CyberNinjaPhone - Android Controller")
         self.setGeometry(100, 100, 900, 700)
         
         # Apply dark cyber theme
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #000814;
-                color: #00c8ff;
-                font-family: 'Consolas', 'Monaco', monospace;
-            }
-            QGroupBox {
-                border: 2px solid #00c8ff;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #00ffff;
-            }
-            QLineEdit, QTextEdit, QComboBox, QSpinBox {
-                background-color: #001f3f;
-                color: #00c8ff;
-                border: 1px solid #00c8ff;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #00c8ff;
-                background-color: #000814;
-            }
-            QTabBar::tab {
-                background-color: #001f3f;
-                color: #00c8ff;
-                padding: 8px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #003366;
-                border-bottom: 2px solid #00ffff;
-            }
-        """)
+        self.setStyleSheet(MAIN_STYLE)
         
         # Main layout
         main_layout = QVBoxLayout()
@@ -547,53 +904,52 @@ class CyberPhoneNinja(QWidget):
         # Title
         title = QLabel("🥷 CyberNinjaPhone - Android Controller")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: bold;
-            color: #00ffff;
-            padding: 10px;
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 #001f3f, stop:0.5 #003366, stop:1 #001f3f);
-            border-radius: 5px;
-        """)
+        title.setStyleSheet(TITLE_STYLE)
         main_layout.addWidget(title)
         
         # Tab widget
-        tabs = QTabWidget()
+        self.tabs = QTabWidget()
         
         # Connection tab
         connection_tab = self.createConnectionTab()
-        tabs.addTab(connection_tab, "🔌 Connection")
+        self.tabs.addTab(connection_tab, "🔌 Connection")
         
         # Control tab
         control_tab = self.createControlTab()
-        tabs.addTab(control_tab, "🎮 Control")
+        self.tabs.addTab(control_tab, "🎮 Control")
         
         # Recording tab
         recording_tab = self.createRecordingTab()
-        tabs.addTab(recording_tab, "🎥 Recording")
+        self.tabs.addTab(recording_tab, "🎥 Recording")
         
-        # Profiles tab
-        profiles_tab = self.createProfilesTab()
-        tabs.addTab(profiles_tab, "💾 Profiles")
+        # Profiles tab, built the first time it is opened
+        self.profile_list = None
+        self.profiles_tab = QWidget()
+        profiles_layout = QVBoxLayout()
+        profiles_layout.setContentsMargins(0, 0, 0, 0)
+        self.profiles_tab.setLayout(profiles_layout)
+        self.tabs.addTab(self.profiles_tab, "💾 Profiles")
         
         # Advanced tab
         advanced_tab = self.createAdvancedTab()
-        tabs.addTab(advanced_tab, "⚙️ Advanced")
+        self.tabs.addTab(advanced_tab, "⚙️ Advanced")
         
-        main_layout.addWidget(tabs)
+        self.tabs.currentChanged.connect(self.onTabChanged)
+        main_layout.addWidget(self.tabs)
         
         # Log output
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_output.setMaximumHeight(150)
-        self.log_output.setStyleSheet("""
-            background-color: #000000;
-            color: #00ff00;
-            font-family: monospace;
-            font-size: 12px;
-            border: 1px solid #00ff00;
-        """)
+        self.log_output.setStyleSheet(LOG_STYLE)
+        
+        # Messages are batched and appended to the widget once per interval
+        self.log_buffer = []
+        self.log_timer = QTimer(self)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self.log_timer.timeout.connect(self.flushLog)
         
         log_group = QGroupBox("📋 System Log")
         log_layout = QVBoxLayout()
@@ -617,19 +973,14 @@ class CyberPhoneNinja(QWidget):
         
         # Status bar
         self.status_label = QLabel("⚡ System Ready")
-        self.status_label.setStyleSheet("""
-            background-color: #001f3f;
-            color: #00ffff;
-            padding: 5px;
-            border: 1px solid #00c8ff;
-            border-radius: 3px;
-        """)
+        self.status_label.setStyleSheet(STATUS_STYLE)
         main_layout.addWidget(self.status_label)
         
         self.setLayout(main_layout)
         
         # Connect signals
         self.log_message.connect(self.log)
+        self.watchScrcpySettings()
         
         # Setup system tray
         self.setupSystemTray()
@@ -679,6 +1030,8 @@ class CyberPhoneNinja(QWidget):
         ip_row = QHBoxLayout()
         self.ip_input = QLineEdit()
         self.ip_input.setPlaceholderText("192.168.1.100")
+        self.ip_input.textChanged.connect(self.onIpChanged)
+        self.scan_ip_base = DEFAULT_IP_BASE
         self.port_spin = QSpinBox()
         self.port_spin.setRange(1, 65535)
         self.port_spin.setValue(5555)
@@ -696,6 +1049,12 @@ class CyberPhoneNinja(QWidget):
         self.btn_connect_wifi = AnimatedButton("Connect", "📶")
         self.scan_progress = QLabel("")
         
+        # Scan progress is repainted on a timer rather than on every tick
+        self.pending_progress = 0
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_INTERVAL)
+        self.progress_timer.timeout.connect(self.updateScanProgress)
+        
         self.btn_scan.clicked.connect(self.scanNetwork)
         self.btn_connect_wifi.clicked.connect(self.connectWireless)
         
@@ -924,6 +1283,12 @@ class CyberPhoneNinja(QWidget):
         widget.setLayout(layout)
         return widget
         
+    def onTabChanged(self, index):
+        """Build the profiles tab the first time it is shown"""
+        if self.profile_list is None and self.tabs.widget(index) is self.profiles_tab:
+            self.profiles_tab.layout().addWidget(self.createProfilesTab())
+            self.updateProfileList()
+            
     def createProfilesTab(self):
         """Create profiles management tab"""
         widget = QWidget()
@@ -1030,14 +1395,11 @@ class CyberPhoneNinja(QWidget):
         
         terminal_layout.addLayout(cmd_row)
         
-        self.adb_output = QTextEdit()
+        self.adb_output = QPlainTextEdit()
         self.adb_output.setReadOnly(True)
+        self.adb_output.setMaximumBlockCount(LOG_MAX_LINES)
         self.adb_output.setMaximumHeight(100)
-        self.adb_output.setStyleSheet("""
-            background-color: #000000;
-            color: #00ff00;
-            font-family: monospace;
-        """)
+        self.adb_output.setStyleSheet(TERMINAL_STYLE)
         
         terminal_layout.addWidget(self.adb_output)
         
@@ -1091,28 +1453,41 @@ class CyberPhoneNinja(QWidget):
         """Toggle wireless mode settings"""
         self.wireless_group.setEnabled(checked)
         
+    def onIpChanged(self, text):
+        """Derive the /24 scan base from the IP field as it is edited"""
+        self.scan_ip_base = ".".join(text.split(".")[:3]) if text else DEFAULT_IP_BASE
+        
     def scanNetwork(self):
         """Scan network for devices"""
         if self.network_scanner and self.network_scanner.isRunning():
             self.log("Network scan already in progress")
             return
             
-        ip_base = ".".join(self.ip_input.text().split(".")[:3]) if self.ip_input.text() else "192.168.1"
+        ip_base = self.scan_ip_base
         port = self.port_spin.value()
         
         self.network_scanner = NetworkScanner(ip_base, port)
         self.network_scanner.device_found.connect(self.onDeviceFound)
         self.network_scanner.scan_complete.connect(self.onScanComplete)
-        self.network_scanner.progress.connect(
-            lambda p: self.scan_progress.setText(f"Scanning... {p}%")
-        )
+        self.network_scanner.progress.connect(self.onScanProgress)
         
         self.log(f"Starting network scan on {ip_base}.0/24:{port}")
+        self.pending_progress = 0
+        self.updateScanProgress()
+        self.progress_timer.start()
         self.network_scanner.start()
         
+    def onScanProgress(self, percent):
+        """Record scan progress for the next label update"""
+        self.pending_progress = percent
+        
+    def updateScanProgress(self):
+        """Show the latest scan progress"""
+        self.scan_progress.setText(f"Scanning... {self.pending_progress}%")
+        
     def onDeviceFound(self, ip, port):
         """Handle device found during scan"""
-        device_id = f"{ip}:{port}"
+        device_id = make_device_id(ip, port)
         self.log(f"Found device: {device_id}")
         
         device = Device(
@@ -1121,8 +1496,8 @@ class CyberPhoneNinja(QWidget):
             status=DeviceStatus.ONLINE,
             mode=ConnectionMode.WIRELESS,
             ip=ip,
-            port=int(port),
-            last_seen=datetime.now()
+            port=port,
+            last_seen=time.time()
         )
         
         self.devices[device_id] = device
@@ -1130,6 +1505,7 @@ class CyberPhoneNinja(QWidget):
         
     def onScanComplete(self, devices):
         """Handle scan completion"""
+        self.progress_timer.stop()
         self.scan_progress.setText("")
         self.log(f"Network scan complete. Found {len(devices)} device(s)")
         
@@ -1142,8 +1518,7 @@ class CyberPhoneNinja(QWidget):
             self.log("Please enter an IP address")
             return
             
-        device_id = f"{ip}:{port}"
-        self.connectToDevice(device_id)
+        self.connectToDevice(make_device_id(ip, port))
         
     def connectDevice(self):
         """Connect to selected device"""
@@ -1151,32 +1526,39 @@ class CyberPhoneNinja(QWidget):
         if device_id:
             self.connectToDevice(device_id)
             
+    def runAdb(self, args: List[str], on_finished, on_failed):
+        """Run an adb command off the GUI thread
+        
+        on_finished receives the CompletedProcess and on_failed the error
+        message; both are called back on the GUI thread.
+        """
+        task = AdbTask(["adb", *args])
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        self.adb_pool.start(task)
+        
     def connectToDevice(self, device_id):
         """Connect to a specific device"""
-        try:
-            self.log(f"Connecting to {device_id}...")
+        self.log(f"Connecting to {device_id}...")
+        self.runAdb(
+            ["connect", device_id],
+            lambda result: self.onDeviceConnected(device_id, result),
+            lambda error: self.log(f"Connection error: {error}")
+        )
+        
+    def onDeviceConnected(self, device_id, result):
+        """Handle the result of adb connect"""
+        if "connected" in result.stdout.lower():
+            self.log(f"Successfully connected to {device_id}")
             
-            result = subprocess.run(
-                ["adb", "connect", device_id],
-                capture_output=True,
-                text=True,
-                timeout=ADB_TIMEOUT
-            )
+            device = self.devices.get(device_id, Device(id=device_id))
+            device.status = DeviceStatus.ONLINE
+            device.last_seen = time.time()
+            self.devices[device_id] = device
             
-            if "connected" in result.stdout.lower():
-                self.log(f"Successfully connected to {device_id}")
-                
-                device = self.devices.get(device_id, Device(id=device_id))
-                device.status = DeviceStatus.ONLINE
-                device.last_seen = datetime.now()
-                self.devices[device_id] = device
-                
-                self.updateStatus(f"Connected to {device_id}")
-            else:
-                self.log(f"Failed to connect: {result.stdout}")
-                
-        except Exception as e:
-            self.log(f"Connection error: {e}")
+            self.updateStatus(f"Connected to {device_id}")
+        else:
+            self.log(f"Failed to connect: {result.stdout}")
             
     def disconnectDevice(self):
         """Disconnect from selected device"""
@@ -1186,32 +1568,38 @@ class CyberPhoneNinja(QWidget):
             
     def disconnectFromDevice(self, device_id):
         """Disconnect from a specific device"""
-        try:
-            self.log(f"Disconnecting from {device_id}...")
-            
-            result = subprocess.run(
-                ["adb", "disconnect", device_id],
-                capture_output=True,
-                text=True,
-                timeout=ADB_TIMEOUT
-            )
-            
-            self.log(f"Disconnected: {result.stdout}")
-            
-            if device_id in self.devices:
-                self.devices[device_id].status = DeviceStatus.OFFLINE
-                
-            self.updateStatus(f"Disconnected from {device_id}")
-            
-        except Exception as e:
-            self.log(f"Disconnect error: {e}")
+        self.log(f"Disconnecting from {device_id}...")
+        self.runAdb(
+            ["disconnect", device_id],
+            lambda result: self.onDeviceDisconnected(device_id, result),
+            lambda error: self.log(f"Disconnect error: {error}")
+        )
+        
+    def onDeviceDisconnected(self, device_id, result):
+        """Handle the result of adb disconnect"""
+        self.log(f"Disconnected: {result.stdout}")
+        
+        if device_id in self.devices:
+            self.devices[device_id].status = DeviceStatus.OFFLINE
             
+        self.updateStatus(f"Disconnected from {device_id}")
+        
     def reconnectAll(self):
         """Reconnect to all known devices"""
         self.log("Reconnecting to all devices...")
+        self.runAdb(
+            ["devices"],
+            self.onReconnectDeviceList,
+            lambda error: self.log(f"Failed to update device list: {error}")
+        )
+        
+    def onReconnectDeviceList(self, result):
+        """Connect only the known devices adb does not already report as attached"""
+        states = parse_adb_devices(result.stdout)
         
         for device_id in self.devices:
-            self.connectToDevice(device_id)
+            if states.get(device_id) != "device":
+                self.connectToDevice(device_id)
             
     def launchScrcpy(self):
         """Launch scrcpy for selected device"""
@@ -1229,45 +1617,82 @@ class CyberPhoneNinja(QWidget):
             return
             
         # Build command
-        cmd = [self.scrcpy_path.text(), "-s", device_id]
+        cmd = [self.scrcpy_path.text(), "-s", device_id, *self.scrcpyOptions()]
+        
+        # Launch process
+        try:
+            self.log(f"Launching: {' '.join(cmd)}")
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                close_fds=True,
+                **SCRCPY_POPEN_ARGS
+            )
+            self.scrcpy_processes[device_id] = process
+            self.log(f"Scrcpy launched for {device_id}")
+            
+        except Exception as e:
+            self.log(f"Failed to launch scrcpy: {e}")
+            
+    def watchScrcpySettings(self):
+        """Drop the cached scrcpy options whenever a launch setting changes"""
+        for signal in (
+            self.bitrate_input.textChanged,
+            self.fps_spin.valueChanged,
+            self.check_fullscreen.toggled,
+            self.check_always_on_top.toggled,
+            self.check_no_control.toggled,
+            self.check_record.toggled,
+            self.record_path.textChanged,
+            self.check_time_limit.toggled,
+            self.time_limit_spin.valueChanged,
+            self.custom_options.textChanged,
+        ):
+            signal.connect(self.settingsChanged)
+            
+    def settingsChanged(self):
+        """Invalidate the cached scrcpy options"""
+        self.scrcpy_options = None
+        
+    def scrcpyOptions(self) -> List[str]:
+        """Return the scrcpy options for the current settings, without -s <id>"""
+        if self.scrcpy_options is None:
+            self.scrcpy_options = self.buildScrcpyOptions()
+        return self.scrcpy_options
+        
+    def buildScrcpyOptions(self) -> List[str]:
+        """Build the scrcpy options from the settings widgets"""
+        options = []
         
         # Add display options
         if self.bitrate_input.text():
-            cmd.extend(["--video-bit-rate", self.bitrate_input.text()])
+            options.extend(["--video-bit-rate", self.bitrate_input.text()])
             
         if self.fps_spin.value():
-            cmd.extend(["--max-fps", str(self.fps_spin.value())])
+            options.extend(["--max-fps", str(self.fps_spin.value())])
             
         if self.check_fullscreen.isChecked():
-            cmd.append("--fullscreen")
+            options.append("--fullscreen")
             
         if self.check_always_on_top.isChecked():
-            cmd.append("--always-on-top")
+            options.append("--always-on-top")
             
         if self.check_no_control.isChecked():
-            cmd.append("--no-control")
+            options.append("--no-control")
             
         # Add recording options
         if self.check_record.isChecked():
-            cmd.extend(["--record", self.record_path.text()])
+            options.extend(["--record", self.record_path.text()])
             
             if self.check_time_limit.isChecked():
-                cmd.extend(["--time-limit", str(self.time_limit_spin.value())])
+                options.extend(["--time-limit", str(self.time_limit_spin.value())])
                 
         # Add custom options
         custom = self.custom_options.toPlainText().strip()
         if custom:
-            cmd.extend(custom.split())
-            
-        # Launch process
-        try:
-            self.log(f"Launching: {' '.join(cmd)}")
-            process = subprocess.Popen(cmd)
-            self.scrcpy_processes[device_id] = process
-            self.log(f"Scrcpy launched for {device_id}")
+            options.extend(custom.split())
             
-        except Exception as e:
-            self.log(f"Failed to launch scrcpy: {e}")
+        return options
             
     def stopScrcpy(self):
         """Stop scrcpy for selected device"""
@@ -1278,21 +1703,52 @@ class CyberPhoneNinja(QWidget):
     def stopScrcpyForDevice(self, device_id):
         """Stop scrcpy for specific device"""
         if device_id in self.scrcpy_processes:
-            process = self.scrcpy_processes[device_id]
-            process.terminate()
-            del self.scrcpy_processes[device_id]
+            process = self.scrcpy_processes.pop(device_id)
+            if process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
             self.log(f"Stopped scrcpy for {device_id}")
             
+    def reapScrcpyProcesses(self):
+        """Drop scrcpy processes that have already exited"""
+        exited = [
+            device_id for device_id, process in self.scrcpy_processes.items()
+            if process.poll() is not None
+        ]
+        for device_id in exited:
+            del self.scrcpy_processes[device_id]
+            self.log(f"Scrcpy exited for {device_id}")
+        now = time.monotonic()
+        still_stopping = []
+        for process, deadline in self.stopping_processes:
+            if process.poll() is None:
+                if now >= deadline:
+                    process.kill()
+                still_stopping.append((process, deadline))
+        self.stopping_processes = still_stopping
+            
     def launchAllDevices(self):
         """Launch scrcpy for all connected devices"""
-        for device_id, device in self.devices.items():
-            if device.status == DeviceStatus.ONLINE:
-                self.launchScrcpyForDevice(device_id)
+        online = [
+            device_id for device_id, device in self.devices.items()
+            if device.status == DeviceStatus.ONLINE
+        ]
+        for device_id in online:
+            self.launchScrcpyForDevice(device_id)
                 
     def stopAllDevices(self):
-        """Stop all scrcpy processes"""
-        for device_id in list(self.scrcpy_processes.keys()):
-            self.stopScrcpyForDevice(device_id)
+        """Terminate all scrcpy processes without waiting; the reaper kills stragglers"""
+        deadline = time.monotonic() + SCRCPY_STOP_GRACE
+        for device_id, process in self.scrcpy_processes.items():
+            if process.poll() is None:
+                process.terminate()
+                self.stopping_processes.append((process, deadline))
+            self.log(f"Stopped scrcpy for {device_id}")
+        self.scrcpy_processes.clear()
             
     def startRecording(self):
         """Start recording"""
@@ -1373,6 +1829,9 @@ class CyberPhoneNinja(QWidget):
                 
     def updateProfileList(self):
         """Update profile list widget"""
+        if self.profile_list is None:
+            return  # Filled in when the profiles tab is first opened
+            
         self.profile_list.clear()
         for name in self.profiles:
             self.profile_list.addItem(name)
@@ -1391,7 +1850,7 @@ class CyberPhoneNinja(QWidget):
         """Browse for ADB executable"""
         filename, _ = QFileDialog.getOpenFileName(
             self, "Select ADB Executable",
-            "", "Executable (*.exe)" if platform.system() == "Windows" else "All Files (*)"
+            "", EXE_FILTER
         )
         if filename:
             self.adb_path.setText(filename)
@@ -1400,7 +1859,7 @@ class CyberPhoneNinja(QWidget):
         """Browse for scrcpy executable"""
         filename, _ = QFileDialog.getOpenFileName(
             self, "Select Scrcpy Executable",
-            "", "Executable (*.exe)" if platform.system() == "Windows" else "All Files (*)"
+            "", EXE_FILTER
         )
         if filename:
             self.scrcpy_path.setText(filename)
@@ -1413,109 +1872,150 @@ class CyberPhoneNinja(QWidget):
             
         device_id = self.device_combo.currentData()
         
-        try:
-            full_cmd = ["adb"]
-            if device_id:
-                full_cmd.extend(["-s", device_id])
-            full_cmd.extend(cmd.split())
-            
-            result = subprocess.run(
-                full_cmd,
-                capture_output=True,
-                text=True,
-                timeout=ADB_TIMEOUT
-            )
-            
-            output = result.stdout + result.stderr
-            self.adb_output.setText(output)
-            
-        except Exception as e:
-            self.adb_output.setText(f"Error: {e}")
+        args = []
+        if device_id:
+            args.extend(["-s", device_id])
+        args.extend(cmd.split())
+        
+        self.runAdb(
+            args,
+            lambda result: self.adb_output.setPlainText(result.stdout + result.stderr),
+            lambda error: self.adb_output.setPlainText(f"Error: {error}")
+        )
             
     def openDeviceManager(self):
         """Open device manager dialog"""
         dialog = DeviceManagerDialog(self, self.devices)
+        self.device_list_updated.connect(dialog.updateTable)
         dialog.exec_()
+        dialog.deleteLater()
         self.updateDeviceCombo()
         
     def updateDeviceList(self):
         """Update device list from ADB"""
-        try:
-            result = subprocess.run(
-                ["adb", "devices"],
-                capture_output=True,
-                text=True,
-                timeout=ADB_TIMEOUT
-            )
-            
-            for line in result.stdout.splitlines()[1:]:
-                if "\t" in line:
-                    device_id, status = line.split("\t")
-                    
-                    device = self.devices.get(device_id, Device(id=device_id))
-                    device.status = DeviceStatus.ONLINE if status == "device" else DeviceStatus.OFFLINE
-                    device.mode = ConnectionMode.WIRELESS if ":" in device_id else ConnectionMode.USB
-                    device.last_seen = datetime.now()
-                    
-                    self.devices[device_id] = device
-                    
-            self.updateDeviceCombo()
+        self.runAdb(
+            ["devices"],
+            self.onDeviceList,
+            lambda error: self.log(f"Failed to update device list: {error}")
+        )
+        
+    def onDeviceList(self, result):
+        """Apply the output of adb devices"""
+        now = time.time()
+        devices = self.devices
+        online, offline = DeviceStatus.ONLINE, DeviceStatus.OFFLINE
+        
+        for device_id, state in parse_adb_devices(result.stdout).items():
+            status = online if state == "device" else offline
             
-        except Exception as e:
-            self.log(f"Failed to update device list: {e}")
+            device = devices.get(device_id)
+            if device is None:
+                device = devices[device_id] = Device(id=device_id, status=status)
+            elif device.status is not status:
+                device.status = status
+                
+            if device.mode is ConnectionMode.UNKNOWN:
+                device.mode = ConnectionMode.WIRELESS if ":" in device_id else ConnectionMode.USB
+            device.last_seen = now
+                
+        self.updateDeviceCombo()
+        self.device_list_updated.emit()
             
     def updateDeviceCombo(self):
         """Update device combo box"""
+        state = tuple(
+            (device_id, device.name, device.status)
+            for device_id, device in self.devices.items()
+        )
+        if state == self.device_combo_state:
+            return
+        self.device_combo_state = state
+        
+        current = self.device_combo.currentData()
+        self.device_combo.blockSignals(True)
         self.device_combo.clear()
         
         for device_id, device in self.devices.items():
-            display = f"{device.name or device_id} ({device.status.value})"
+            display = f"{device.name or device_id} ({device.status_text})"
             self.device_combo.addItem(display, device_id)
             
+        index = self.device_combo.findData(current)
+        if index >= 0:
+            self.device_combo.setCurrentIndex(index)
+        self.device_combo.blockSignals(False)
+            
     def startMonitoring(self):
         """Start device monitoring"""
         self.device_monitor = DeviceMonitor()
-        self.device_monitor.device_connected.connect(
-            lambda d: self.log(f"Device connected: {d}")
-        )
-        self.device_monitor.device_disconnected.connect(
-            lambda d: self.log(f"Device disconnected: {d}")
-        )
-        self.device_monitor.status_changed.connect(
-            lambda d, s: self.log(f"Device {d} status: {s}")
-        )
+        
+        events = {
+            "connected": self.device_monitor.device_connected,
+            "disconnected": self.device_monitor.device_disconnected,
+            "status_changed": self.device_monitor.status_changed,
+        }
+        for event, signal in events.items():
+            signal.connect(functools.partial(self.onMonitorEvent, event))
+            
         self.device_monitor.start()
         
+    def onMonitorEvent(self, event, *args):
+        """Log a device monitor event"""
+        self.log(self.MONITOR_MESSAGES[event].format(*args))
+        
     def log(self, message):
         """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_output.append(f"[{timestamp}] {message}")
-        
-        # Auto-scroll to bottom
-        cursor = self.log_output.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.log_output.setTextCursor(cursor)
+        timestamp = self.logTimestamp()
+        self.log_buffer.append(f"[{timestamp}] {message}")
+        if not self.log_timer.isActive():
+            self.log_timer.start()
         
         # Also write to file
+        if self.log_file:
+            try:
+                self.log_file.write(f"[{timestamp}] {message}\n")
+            except Exception:
+                pass
+                
+    def logTimestamp(self):
+        """Return the current HH:MM:SS, formatting it at most once per second"""
+        now = int(time.time())
+        if now != self.log_stamp[0]:
+            self.log_stamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self.log_stamp[1]
+        
+    def openLogFile(self):
+        """Open the log file once for buffered appends"""
         try:
-            with open(LOG_FILE, "a") as f:
-                f.write(f"[{timestamp}] {message}\n")
+            log_file = open(LOG_FILE, "a", buffering=8192)
         except Exception:
-            pass
+            return None
+        atexit.register(log_file.close)
+        return log_file
+            
+    def flushLog(self):
+        """Append buffered log messages in a single document update"""
+        if not self.log_buffer:
+            return
+            
+        # Scrolls along by itself while the view is at the bottom
+        self.log_output.appendPlainText("\n".join(self.log_buffer))
+        self.log_buffer.clear()
             
     def clearLog(self):
         """Clear log output"""
+        self.log_buffer.clear()
         self.log_output.clear()
         
     def saveLog(self):
         """Save log to file"""
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save Log", 
-            f"cyberphone_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            f"cyberphone_log_{time.strftime('%Y%m%d_%H%M%S')}.txt",
             "Text Files (*.txt)"
         )
         
         if filename:
+            self.flushLog()
             with open(filename, "w") as f:
                 f.write(self.log_output.toPlainText())
             self.log(f"Log saved to {filename}")
@@ -1529,8 +2029,7 @@ class CyberPhoneNinja(QWidget):
         # Load main config
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, "r") as f:
-                    config = json.load(f)
+                config = read_json(CONFIG_FILE)
                     
                 self.scrcpy_path.setText(config.get("scrcpy_path", ""))
                 self.adb_path.setText(config.get("adb_path", ""))
@@ -1546,8 +2045,7 @@ class CyberPhoneNinja(QWidget):
         # Load devices
         if os.path.exists(DEVICES_FILE):
             try:
-                with open(DEVICES_FILE, "r") as f:
-                    devices_data = json.load(f)
+                devices_data = read_json(DEVICES_FILE)
                     
                 for device_id, data in devices_data.items():
                     device = Device(
@@ -1578,27 +2076,35 @@ class CyberPhoneNinja(QWidget):
             "record_path": self.record_path.text()
         }
         
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        self.saveJson(CONFIG_FILE, config)
             
         # Save devices
-        devices_data = {}
-        for device_id, device in self.devices.items():
-            devices_data[device_id] = {
+        devices_data = {
+            device_id: {
                 "name": device.name,
-                "status": device.status.value,
-                "mode": device.mode.value
+                "status": device.status_text,
+                "mode": device.mode_text
             }
+            for device_id, device in self.devices.items()
+        }
+        
+        self.saveJson(DEVICES_FILE, devices_data)
             
-        with open(DEVICES_FILE, "w") as f:
-            json.dump(devices_data, f, indent=2)
+    def saveJson(self, path, data):
+        """Write data as JSON, skipping the write when the content is unchanged"""
+        content = dump_json(data)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if self.saved_digests.get(path) == digest:
+            return
             
+        write_file_atomic(path, content)
+        self.saved_digests[path] = digest
+        
     def loadProfiles(self):
         """Load saved profiles"""
         if os.path.exists(PROFILES_FILE):
             try:
-                with open(PROFILES_FILE, "r") as f:
-                    profiles_data = json.load(f)
+                profiles_data = read_json(PROFILES_FILE)
                     
                 for name, data in profiles_data.items():
                     profile = Profile(name=name, **data)
@@ -1611,17 +2117,23 @@ class CyberPhoneNinja(QWidget):
                 
     def saveProfiles(self):
         """Save profiles to file"""
-        profiles_data = {}
-        for name, profile in self.profiles.items():
-            profiles_data[name] = asdict(profile)
-            
-        with open(PROFILES_FILE, "w") as f:
-            json.dump(profiles_data, f, indent=2)
+        # Profile fields are all JSON primitives, so asdict's deep copy is unnecessary
+        profiles_data = {
+            name: {slot: getattr(profile, slot) for slot in Profile.__slots__}
+            for name, profile in self.profiles.items()
+        }
+        
+        self.saveJson(PROFILES_FILE, profiles_data)
             
     def closeEvent(self, event):
         """Handle application close"""
-        # Stop all processes
+        # Stop all processes, sharing one grace period since the reaper won't run again
         self.stopAllDevices()
+        for process, deadline in self.stopping_processes:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
         
         # Stop monitoring
         if self.device_monitor:
@@ -1634,6 +2146,9 @@ class CyberPhoneNinja(QWidget):
         # Save configuration
         self.saveConfiguration()
         
+        if self.log_file:
+            self.log_file.flush()
+        
         event.accept()
 
 def main():
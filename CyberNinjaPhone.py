@@ -2,96 +2,327 @@ import sys
 import subprocess
 import os
 import json
+import re
+import shlex
+import signal
 import time
 import socket
+import selectors
+import errno
+import ipaddress
 import threading
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
     QCheckBox, QLineEdit, QFileDialog, QTextEdit, QComboBox, QGroupBox, QDialog,
-    QTableWidget, QTableWidgetItem, QInputDialog
+    QTableWidget, QTableWidgetItem, QInputDialog, QAbstractItemView
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSignal, pyqtSlot,
+    QObject, QRunnable, QThreadPool, QProcess
 )
-from PyQt5.QtGui import QFont, QMovie
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal, pyqtSlot
 
 CONFIG_FILE = "scrcpy_config.json"
 DEVICES_FILE = "devices.json"
+SCAN_WORKERS = 64
+SCAN_TIMEOUT = 0.3
+ADB_SERVER = ("127.0.0.1", 5037)
+ADB_START_LOCK = threading.Lock()
+ADB_COMMAND_TIMEOUT = 5000  # ms
+SCRCPY_WATCH_INTERVAL = 1000  # ms
+SCRCPY_STOP_TIMEOUT = 3000  # ms
+DEVICE_POLL_INTERVAL = 5000  # ms
+DEVICE_POLL_MAX_INTERVAL = 30000  # ms
+DEVICE_POLL_IDLE_TICKS = 3
+TRACK_RETRY_DELAY = 5  # s
+DEVICE_CHECK_TTL = 3  # s
+LOG_FLUSH_INTERVAL = 50  # ms
+LOG_MAX_LINES = 2000
+# scrcpy gets its own session on POSIX so terminal signals aimed at the GUI don't hit it
+SCRCPY_POPEN_ARGS = {"start_new_session": True} if os.name == "posix" else {}
+DEFAULT_IP_BASE = "192.168.1"
+# Same rule as before: a --flag, a bare alphanumeric word, or anything with "="
+SCRCPY_ARG_RE = re.compile(r"--|[^\W_]+$|.*=")
+DANGEROUS_RE = re.compile(r"reboot|fastboot|recovery|bootloader", re.IGNORECASE)
+DEVICE_RE = re.compile(r"^(\S+)\t(?:device|offline)\b", re.MULTILINE)
+
+APP_QSS = """
+    QWidget {
+        background-color: #000814;
+        color: #00c8ff;
+        font-family: Consolas;
+    }
+    QLabel {
+        color: #00c8ff;
+    }
+    QLineEdit, QTextEdit, QComboBox, QTableWidget {
+        background-color: #001f3f;
+        color: #00c8ff;
+        border: 1px solid #00c8ff;
+    }
+    QCheckBox {
+        color: #00c8ff;
+    }
+    QGroupBox {
+        color: #00c8ff;
+        border: 1px solid #00c8ff;
+        margin-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 3px 0 3px;
+    }
+    QPushButton {
+        background-color: #001f3f;
+        color: #00c8ff;
+        border: 1px solid #00c8ff;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QPushButton:hover {
+        background-color: #003366;
+        border: 2px solid #00c8ff;
+    }
+"""
+
+def write_file_atomic(path, data):
+    # Write beside the target and swap it in, so a crash never leaves half a file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def dump_json(obj):
+    # Compact UTF-8 (emoji names stay as-is); orjson when installed, same bytes either way
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+def recv_exact(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("adb server closed the connection")
+        data += chunk
+    return data
+
+def adb_send(sock, command):
+    request = command.encode()
+    sock.sendall(b"%04x" % len(request) + request)
+    if recv_exact(sock, 4) != b"OKAY":
+        raise RuntimeError(recv_exact(sock, int(recv_exact(sock, 4), 16)).decode())
+
+def start_adb_server():
+    # Same as what any adb command does first; a no-op when the server is already up
+    try:
+        subprocess.run(["adb", "start-server"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+    except subprocess.TimeoutExpired:
+        pass
+
+def adb_server_socket(timeout):
+    # Talking to 5037 directly skips adb's auto-start, so do it ourselves on a refusal
+    try:
+        return socket.create_connection(ADB_SERVER, timeout=timeout)
+    except ConnectionRefusedError:
+        with ADB_START_LOCK:
+            # Another thread may have started it while this one waited
+            try:
+                return socket.create_connection(ADB_SERVER, timeout=timeout)
+            except ConnectionRefusedError:
+                start_adb_server()
+        return socket.create_connection(ADB_SERVER, timeout=timeout)
+
+def adb_host(command, timeout=2):
+    # Host-side request (devices, connect) sent straight to the adb server
+    with adb_server_socket(timeout) as sock:
+        adb_send(sock, command)
+        return recv_exact(sock, int(recv_exact(sock, 4), 16)).decode()
+
+def connect_ok(reply):
+    # Covers "connected to" and "already connected to"
+    return "connected" in reply.lower()
+
+def adb_device(device_id, service, timeout=5):
+    # Device service (e.g. tcpip:5555) over the adb server's transport, no adb process
+    with adb_server_socket(timeout) as sock:
+        adb_send(sock, f"host:transport:{device_id}")
+        adb_send(sock, service)
+        chunks = []
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                return b"".join(chunks).decode(errors="replace")
+            chunks.append(chunk)
+
+def parse_adb_devices(output):
+    return {device_id: "wireless" if ":" in device_id else "usb" for device_id in DEVICE_RE.findall(output)}
+
+class AdbSession:
+    # One long-lived `adb shell` per device, fed commands over stdin
+    SENTINEL = "__END__"
+
+    def __init__(self, device_id):
+        self.device_id = device_id
+        self.proc = None
+        self.lines = None
+        self.lock = threading.Lock()
+
+    def _start(self):
+        self.proc = subprocess.Popen(["adb", "-s", self.device_id, "shell"], stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        self.lines = queue.Queue()
+        threading.Thread(target=self._read, args=(self.proc.stdout, self.lines), daemon=True).start()
+
+    @staticmethod
+    def _read(stream, lines):
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def run(self, command, timeout=2):
+        with self.lock:
+            if self.proc is None or self.proc.poll() is not None:
+                self._start()
+            try:
+                self.proc.stdin.write(f"{command}; echo {self.SENTINEL}\n")
+                self.proc.stdin.flush()
+                output = []
+                deadline = time.monotonic() + timeout
+                while True:
+                    try:
+                        line = self.lines.get(timeout=max(0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        raise TimeoutError(f"adb shell on {self.device_id} timed out")
+                    if line is None:
+                        raise ConnectionError(f"adb shell on {self.device_id} closed: {' '.join(output).strip()}")
+                    line = line.rstrip("\r\n")
+                    # Output without a trailing newline leaves the sentinel on its last line
+                    if line.endswith(self.SENTINEL):
+                        output.append(line[:-len(self.SENTINEL)])
+                        return "\n".join(output).rstrip("\n")
+                    output.append(line)
+            except Exception:
+                self.close()
+                raise
+
+    def close(self):
+        if self.proc and self.proc.poll() is None:
+            self.proc.kill()
+        self.proc = None
+
+def find_open_hosts(ips):
+    # One non-blocking connect per host, all waited on together
+    selector = selectors.DefaultSelector()
+    try:
+        for ip in ips:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            if sock.connect_ex((ip, 5555)) in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                selector.register(sock, selectors.EVENT_WRITE, ip)
+            else:
+                sock.close()
+        open_ips = set()
+        deadline = time.monotonic() + SCAN_TIMEOUT
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    open_ips.add(key.data)
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+        return [ip for ip in ips if ip in open_ips]
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+def adb_connect_host(ip):
+    try:
+        return connect_ok(adb_host(f"host:connect:{ip}:5555"))
+    except Exception:
+        return False
+
+def arg_lexer(text):
+    # Shell-style quoting, but backslashes stay literal so Windows paths survive
+    lexer = shlex.shlex(text, posix=True)
+    lexer.whitespace_split = True
+    lexer.escape = ""
+    lexer.commenters = ""
+    return lexer
+
+def split_args(text):
+    return list(arg_lexer(text))
+
+def split_adb_command(text):
+    # adb hands everything after "shell" to the device's shell, so that part keeps the user's quoting
+    lexer = arg_lexer(text)
+    args = []
+    for token in lexer:
+        args.append(token)
+        if token == "shell":
+            remote = lexer.instream.read().strip()
+            if remote:
+                args.append(remote)
+            break
+    return args
+
+def subnet_base(text):
+    try:
+        ip = ipaddress.IPv4Address(text.strip().split(":")[0])
+    except ValueError:
+        return DEFAULT_IP_BASE
+    return str(ip).rsplit(".", 1)[0]
+
+def scan_subnet(ip_base):
+    open_ips = find_open_hosts([str(host) for host in ipaddress.IPv4Network(f"{ip_base}.0/24").hosts()])
+    if not open_ips:
+        return []
+    with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(open_ips))) as executor:
+        return [ip for ip, found in zip(open_ips, executor.map(adb_connect_host, open_ips)) if found]
+
+class WorkerSignals(QObject):
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class AdbWorker(QRunnable):
+    # Runs a blocking adb call on the thread pool and reports back through signals
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
 
-class AnimatedButton(QPushButton):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._glow = 0
-        self.setStyleSheet(self._get_style())
-
-    @pyqtProperty(int)
-    def glow(self):
-        return self._glow
-
-    @glow.setter
-    def glow(self, value):
-        self._glow = value
-        self.setStyleSheet(self._get_style())
-
-    def _get_style(self):
-        return f"""
-            QPushButton {{
-                background-color: #001f3f;
-                color: #00c8ff;
-                border: 1px solid #00c8ff;
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: #003366;
-                border: 2px solid #00c8ff;
-            }}
-        """
-
-    def enterEvent(self, event):
-        self._animate_glow(5)
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self._animate_glow(0)
-        super().leaveEvent(event)
-
-    def _animate_glow(self, end_value):
+    def run(self):
         try:
-            anim = QPropertyAnimation(self, b"glow")
-            anim.setDuration(200)
-            anim.setStartValue(self._glow)
-            anim.setEndValue(end_value)
-            anim.setEasingCurve(QEasingCurve.InOutQuad)
-            anim.start()
+            result = self.fn(*self.args)
         except Exception as e:
-            print(f"Animation error: {e}")
+            self.signals.error.emit(str(e))
+            return
+        self.signals.result.emit(result)
+
+class AnimatedButton(QPushButton):
+    # Styled by APP_QSS like every other widget
+    pass
 
 class DeviceManagerDialog(QDialog):
     def __init__(self, parent, devices, update_callback):
         super().__init__(parent)
         self.setWindowTitle("🥷📋 Manage Devices")
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #000814;
-                color: #00c8ff;
-                font-family: Consolas;
-            }
-            QTableWidget {
-                background-color: #001f3f;
-                color: #00c8ff;
-                border: 1px solid #00c8ff;
-            }
-            QPushButton {
-                background-color: #001f3f;
-                color: #00c8ff;
-                border: 1px solid #00c8ff;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #003366;
-                border: 2px solid #00c8ff;
-            }
-        """)
         self.setGeometry(150, 150, 500, 400)
         self.devices = devices
         self.update_callback = update_callback
@@ -101,7 +332,10 @@ class DeviceManagerDialog(QDialog):
         self.table.setColumnCount(3)
         self.table.setHorizontalHeaderLabels(["IP:Port", "Status", "Name"])
         self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.update_table()
+        self.table.resizeColumnsToContents()
 
         button_layout = QHBoxLayout()
         self.btn_refresh = AnimatedButton("🔄🔍 Refresh/Scan")
@@ -133,35 +367,22 @@ class DeviceManagerDialog(QDialog):
             self.table.setItem(row, 0, QTableWidgetItem(ip))
             self.table.setItem(row, 1, QTableWidgetItem(data.get("status", "Unknown")))
             self.table.setItem(row, 2, QTableWidgetItem(data.get("name", "")))
-        self.table.resizeColumnsToContents()
 
     def refresh_devices(self):
-        def scan():
-            ip_base = ".".join(self.parent().ip_input.text().split(".")[:3]) or "192.168.1"
-            self.parent().log(f"🔍🌐📱 Scanning network: {ip_base}.0/24 ...")
-            new_devices = {}
-            for i in range(1, 255):
-                ip = f"{ip_base}.{i}"
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(0.1)
-                    result = sock.connect_ex((ip, 5555))
-                    sock.close()
-                    if result == 0:
-                        try:
-                            adb_result = subprocess.check_output(["adb", "connect", f"{ip}:5555"], stderr=subprocess.STDOUT, timeout=2)
-                            msg = adb_result.decode()
-                            if "connected" in msg.lower() or "already connected" in msg.lower():
-                                new_devices[f"{ip}:5555"] = {"status": "Online", "name": f"Device_{i}", "last_status": "Online"}
-                                self.parent().log(f"✅📱 Found device: {ip}:5555")
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-            self.devices.update(new_devices)
-            self.parent().update_device_list_safely()
-            self.parent().log(f"🟢📱🌐 Scan done: {len(new_devices)} new devices")
-        threading.Thread(target=scan, daemon=True).start()
+        ip_base = subnet_base(self.parent().ip_input.text())
+        self.parent().log(f"🔍🌐📱 Scanning network: {ip_base}.0/24 ...")
+        self.parent().start_worker(scan_subnet, ip_base, on_result=self.scan_done,
+                                   on_error=lambda error: self.parent().log(f"🚨🌐 Network scan failed: {error}"))
+
+    def scan_done(self, found_ips):
+        new_devices = {}
+        for ip in found_ips:
+            new_devices[f"{ip}:5555"] = {"status": "Online", "name": f"Device_{ip.rsplit('.', 1)[1]}", "last_status": "Online"}
+            self.parent().log(f"✅📱 Found device: {ip}:5555")
+        self.devices.update(new_devices)
+        self.update_table()
+        self.parent().update_device_list_safely()
+        self.parent().log(f"🟢📱🌐 Scan done: {len(new_devices)} new devices")
 
     def clear_all(self):
         self.devices.clear()
@@ -175,71 +396,41 @@ class DeviceManagerDialog(QDialog):
                 ip += ":5555"
             self.devices[ip] = {"status": "Unknown", "name": ""}
             self.update_table()
+            self.table.resizeColumnsToContents()
             self.parent().update_device_list_safely()
 
     def delete_device(self):
-        selected_rows = self.table.selectedIndexes()
-        if not selected_rows:
+        ips = [self.table.item(index.row(), 0).text() for index in self.table.selectionModel().selectedRows()]
+        if not ips:
             self.parent().log("⚠️📋 No device selected to delete")
             return
-        row = selected_rows[0].row()
-        if 0 <= row < self.table.rowCount():
-            ip = self.table.item(row, 0).text()
-            if ip in self.devices:
-                del self.devices[ip]
-                self.update_table()
-                self.parent().update_device_list_safely()
+        deleted = [ip for ip in ips if self.devices.pop(ip, None) is not None]
+        if deleted:
+            self.update_table()
+            self.parent().update_device_list_safely()
+            for ip in deleted:
                 self.parent().log(f"🗑️🥷 Deleted device: {ip}")
 
     def save_changes(self):
-        try:
-            with open(DEVICES_FILE, "w") as f:
-                json.dump(self.devices, f)
+        # The main window owns devices.json; it logs the error if the write fails
+        if self.parent().save_devices():
             self.update_callback()
             self.accept()
             self.parent().log("💾🥷 Device list saved!")
-        except Exception as e:
-            self.parent().log(f"🚨📂 Error saving devices: {str(e)}")
 
     def show_help(self):
         self.parent().log("❓🥷 For more information, check the README file.")
 
 class CyberScrcpy(QWidget):
     # Custom signal for thread-safe GUI updates
-    DeviceListUpdated = pyqtSignal(list, dict, str, str)
+    DeviceListUpdated = pyqtSignal(dict, dict, str, str)
+    LogMessage = pyqtSignal(str)
+    DevicesChanged = pyqtSignal(str)
 
     def __init__(self):
         super().__init__()
         try:
             self.setWindowTitle("🥷📱⚔️ CyberPhoneNinja ADB Viewer")
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #000814;
-                    color: #00c8ff;
-                    font-family: Consolas;
-                }
-                QLabel {
-                    color: #00c8ff;
-                }
-                QLineEdit, QTextEdit, QComboBox {
-                    background-color: #001f3f;
-                    color: #00c8ff;
-                    border: 1px solid #00c8ff;
-                }
-                QCheckBox {
-                    color: #00c8ff;
-                }
-                QGroupBox {
-                    color: #00c8ff;
-                    border: 1px solid #00c8ff;
-                    margin-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 3px 0 3px;
-                }
-            """)
             self.setGeometry(100, 100, 600, 700)
 
             font_title = QFont("Consolas", 14, QFont.Bold)
@@ -251,13 +442,10 @@ class CyberScrcpy(QWidget):
 
             self.status_label = QLabel("🚨💀🥷Disconnected")
             self.status_label.setFont(font_small)
-            self.status_gif = QMovie("loading.gif") if os.path.exists("loading.gif") else None
-            if self.status_gif:
-                self.status_label.setMovie(self.status_gif)
-                self.status_gif.setPaused(True)
 
             self.device_label = QLabel("Select Device:")
             self.device_combo = QComboBox()
+            self.device_combo.addItem("Select Device")
             self.device_combo.currentIndexChanged.connect(self.update_device_selection)
 
             self.checkbox_wireless = QCheckBox("Enable Wireless Mode")
@@ -310,8 +498,14 @@ class CyberScrcpy(QWidget):
 
             self.log_output = QTextEdit()
             self.log_output.setReadOnly(True)
-            self.log_output.setStyleSheet("background-color: #001f3f; color: #00c8ff;")
             self.log_output.setFont(font_small)
+            # Every entry is a line plus a blank spacer block
+            self.log_output.document().setMaximumBlockCount(LOG_MAX_LINES * 2)
+            self.log_buffer = deque(maxlen=LOG_MAX_LINES)
+            self.log_flush_timer = QTimer(self)
+            self.log_flush_timer.setSingleShot(True)
+            self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+            self.log_flush_timer.timeout.connect(self.flush_log)
 
             layout = QVBoxLayout()
             connection_group = QGroupBox("Connection Settings")
@@ -375,53 +569,75 @@ class CyberScrcpy(QWidget):
             self.record_path = "microscope_record.mp4"
             self.scrcpy_path = ""
             self.device_ip = ""
-            self.devices = []
+            self.devices = {}
             self.device_id = None
             self.scrcpy_process = None
+            self.devices_bytes = None
+            self.devices_lock = threading.Lock()
             self.devices_data = self.load_devices()
+            self.device_manager = None
+            self.config_bytes = None
+            self.scrcpy_path_valid = False
             self.load_config()
             self.reconnect_attempts = {}
             self.last_reconnect_time = {}
             self.last_status = {}
+            self.device_checked_at = {}
+            self.adb_sessions = {}
+            self.device_poll_running = False
+            self.device_poll_pending = False
+            self.track_socket = None
+            self.closing = False
+            self.devices_fingerprint = None
+            self.idle_polls = 0
             self.DeviceListUpdated.connect(self.update_combo_box)
+            self.LogMessage.connect(self.log)
+            self.DevicesChanged.connect(self.on_devices_changed)
 
             self.log("🥷⚔️💥 CyberNinja Phone is ready to go! NINJA MODE ENGAGED")
             self.log("CyberNinja HUD Initialized... Ready to launch scrcpy")
 
+            # Have the adb server up before the tracker and the first poll connect to it
+            try:
+                start_adb_server()
+            except OSError as e:
+                self.log(f"🚨 Could not start ADB server: {str(e)}")
+
             self.device_timer = QTimer()
             self.device_timer.timeout.connect(self.update_device_list_safely)
-            self.device_timer.start(5000)
+            self.device_timer.start(DEVICE_POLL_INTERVAL)
+            # adb pushes plug/unplug events; the timer stays as the slow reconnect sweep
+            threading.Thread(target=self.track_devices, daemon=True).start()
         except Exception as e:
             self.log(f"🛑💣 App initialization failed: {str(e)}")
 
     def load_devices(self):
         try:
-            if os.path.exists(DEVICES_FILE):
-                with open(DEVICES_FILE, "r") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        return {item: {"status": "Unknown", "name": item.split(":")[0]} for item in data}
-                    return data
+            with open(DEVICES_FILE, "rb") as f:
+                raw = f.read()
+            data = json.loads(raw)
+            if isinstance(data, list):
+                return {item: {"status": "Unknown", "name": item.split(":")[0]} for item in data}
+            self.devices_bytes = raw
+            return data
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.log(f"🚨📂 Error loading devices file: {str(e)}")
         return {}
 
     def save_devices(self):
+        # Called from the GUI thread and pool threads; only rewrite when the content moved
         try:
-            with open(DEVICES_FILE, "w") as f:
-                json.dump(self.devices_data, f)
+            with self.devices_lock:
+                payload = dump_json(self.devices_data)
+                if payload != self.devices_bytes:
+                    write_file_atomic(DEVICES_FILE, payload)
+                    self.devices_bytes = payload
+            return True
         except Exception as e:
             self.log(f"🚨📂 Error saving devices: {str(e)}")
-
-    def ensure_adb_server(self):
-        try:
-            result = subprocess.run(["adb", "version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=2)
-            if result.returncode != 0:
-                self.log("🚨 ADB server not running, starting server...")
-                subprocess.run(["adb", "start-server"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=5)
-                self.log("✅ ADB server started")
-        except Exception as e:
-            self.log(f"🚨 Error checking/starting ADB server: {str(e)}")
+            return False
 
     def attempt_reconnect(self, ip, data):
         def reconnect():
@@ -437,8 +653,8 @@ class CyberScrcpy(QWidget):
                 self.last_reconnect_time[ip] = time.time()
                 self.log(f"🔄 Attempting reconnect to {ip} (Attempt {self.reconnect_attempts[ip]}/3)")
                 try:
-                    connect_result = subprocess.check_output(["adb", "connect", ip], stderr=subprocess.STDOUT, text=True, timeout=4)
-                    if "connected" in connect_result.lower() or "already connected" in connect_result.lower():
+                    connect_result = adb_host(f"host:connect:{ip}", timeout=4)
+                    if connect_ok(connect_result):
                         data["status"] = "Online"
                         self.reconnect_attempts[ip] = 0
                         self.last_status[ip] = "Online"
@@ -454,35 +670,39 @@ class CyberScrcpy(QWidget):
                         self.last_status[ip] = "Offline"
         threading.Thread(target=reconnect, daemon=True).start()
 
-    @pyqtSlot(list, dict, str, str)
+    @pyqtSlot(dict, dict, str, str)
     def update_combo_box(self, devices, devices_data, current_device_id, updated_ip):
-        self.device_combo.blockSignals(True)
-        current_text = self.device_combo.currentText()
-        self.device_combo.clear()
-        self.device_combo.addItem("Select Device")
-        seen_ids = set()
+        wanted = {}
         if isinstance(devices_data, dict):
             for ip, data in devices_data.items():
-                if ip not in seen_ids:
-                    display = f"{data.get('name', ip.split(':')[0])} ({ip})" if data.get('name') else f"{ip}"
-                    self.device_combo.addItem(display)
-                    seen_ids.add(ip)
-        for device_id, mode in devices:
-            if device_id not in seen_ids:
-                item_text = f"{device_id} ({mode})"
-                self.device_combo.addItem(item_text)
-                seen_ids.add(device_id)
+                wanted[ip] = f"{data.get('name', ip.split(':')[0])} ({ip})" if data.get('name') else f"{ip}"
+        for device_id, mode in devices.items():
+            if device_id not in wanted:
+                wanted[device_id] = f"{device_id} ({mode})"
                 if device_id not in devices_data:
                     devices_data[device_id] = {"status": "Online", "name": device_id.split(":")[0], "last_status": "Online"}
-        if current_text and self.device_combo.findText(current_text) != -1:
-            self.device_combo.setCurrentText(current_text)
-        elif current_device_id and self.device_combo.findText(current_device_id) != -1:
-            self.device_combo.setCurrentText(current_device_id)
+        combo = self.device_combo
+        combo.blockSignals(True)
+        current_id = combo.currentData()
+        # Patch the combo in place: drop vanished ids, add new ones, fix renamed ones
+        for index in range(combo.count() - 1, 0, -1):
+            if combo.itemData(index) not in wanted:
+                combo.removeItem(index)
+        for device_id, text in wanted.items():
+            index = combo.findData(device_id)
+            if index == -1:
+                combo.addItem(text, device_id)
+            elif combo.itemText(index) != text:
+                combo.setItemText(index, text)
+        if current_id and combo.findData(current_id) != -1:
+            combo.setCurrentIndex(combo.findData(current_id))
+        elif current_device_id and combo.findData(current_device_id) != -1:
+            combo.setCurrentIndex(combo.findData(current_device_id))
         else:
-            self.device_combo.setCurrentIndex(0)
+            combo.setCurrentIndex(0)
             self.device_id = None
             self.status_label.setText("🚨💀🥷Disconnected")
-        self.device_combo.blockSignals(False)
+        combo.blockSignals(False)
         self.update_device_selection()
 
     def toggle_ip_input(self):
@@ -500,6 +720,7 @@ class CyberScrcpy(QWidget):
         path, _ = QFileDialog.getOpenFileName(self, "Select scrcpy.exe", "", "Executable (*.exe)")
         if path:
             self.scrcpy_path = path
+            self.scrcpy_path_valid = os.path.isfile(path)
             self.save_config()
             self.log(f"🧙‍♂️📍 scrcpy path set to: {path}")
 
@@ -515,86 +736,84 @@ class CyberScrcpy(QWidget):
             "ip": self.ip_input.text(),
             "custom_options": self.custom_options_input.text()
         }
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f)
+        payload = dump_json(config)
+        if payload == self.config_bytes:
+            return
+        write_file_atomic(CONFIG_FILE, payload)
+        self.config_bytes = payload
 
     def load_config(self):
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, "r") as f:
-                    data = json.load(f)
-                    self.scrcpy_path = data.get("scrcpy_path", "")
-                    self.record_path = data.get("record_path", "microscope_record.mp4")
-                    self.bit_rate_input.setText(data.get("bitrate", "8M"))
-                    self.max_size_input.setText(data.get("max_size", "1440"))
-                    self.checkbox_fullscreen.setChecked(data.get("fullscreen", False))
-                    self.checkbox_wireless.setChecked(data.get("wireless", False))
-                    self.checkbox_record.setChecked(data.get("record", False))
-                    self.ip_input.setText(data.get("ip", ""))
-                    self.custom_options_input.setText(data.get("custom_options", ""))
-                    self.toggle_ip_input()
-            except Exception as e:
-                self.log(f"🚨💣📂 Error loading config: {str(e)}")
+        try:
+            with open(CONFIG_FILE, "rb") as f:
+                self.config_bytes = f.read()
+            data = json.loads(self.config_bytes)
+            self.scrcpy_path = data.get("scrcpy_path", "")
+            self.scrcpy_path_valid = bool(self.scrcpy_path) and os.path.isfile(self.scrcpy_path)
+            self.record_path = data.get("record_path", "microscope_record.mp4")
+            self.bit_rate_input.setText(data.get("bitrate", "8M"))
+            self.max_size_input.setText(data.get("max_size", "1440"))
+            self.checkbox_fullscreen.setChecked(data.get("fullscreen", False))
+            self.checkbox_wireless.setChecked(data.get("wireless", False))
+            self.checkbox_record.setChecked(data.get("record", False))
+            self.ip_input.setText(data.get("ip", ""))
+            self.custom_options_input.setText(data.get("custom_options", ""))
+            self.toggle_ip_input()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.log(f"🚨💣📂 Error loading config: {str(e)}")
 
     def log(self, text):
+        if threading.current_thread() is not threading.main_thread():
+            self.LogMessage.emit(text)
+            return
         try:
-            self.log_output.append(f"{text}\n")
+            # Lines arriving in a burst (scans, reconnects) go in as one append
+            self.log_buffer.append(f"{text}\n")
+            if not self.log_flush_timer.isActive():
+                self.log_flush_timer.start()
         except Exception as e:
             print(f"Log error: {e}")
 
+    def flush_log(self):
+        if self.log_buffer:
+            self.log_output.append("\n".join(self.log_buffer))
+            self.log_buffer.clear()
+
     def scan_network(self):
-        def scan():
-            if not self.checkbox_wireless.isChecked():
-                self.log("📶⚙️ Enable Wireless Mode to scan for devices.")
-                return
-            ip_base = ".".join(self.ip_input.text().split(".")[:3]) if self.ip_input.text() else "192.168.1"
-            self.log(f"🔍🌐📱 Scanning network: {ip_base}.0/24 ...")
-            found_ips = []
-            for i in range(1, 255):
-                ip = f"{ip_base}.{i}"
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(0.1)
-                    result = sock.connect_ex((ip, 5555))
-                    sock.close()
-                    if result == 0:
-                        try:
-                            adb_result = subprocess.check_output(["adb", "connect", f"{ip}:5555"], stderr=subprocess.STDOUT, timeout=2)
-                            msg = adb_result.decode()
-                            if "connected" in msg.lower() or "already connected" in msg.lower():
-                                found_ips.append(ip)
-                                self.devices_data[f"{ip}:5555"] = {"status": "Online", "name": f"Device_{i}", "last_status": "Online"}
-                                self.save_devices()
-                                self.DeviceListUpdated.emit(self.devices, self.devices_data, self.device_id or "", f"{ip}:5555")
-                                self.log(f"✅📱 Found device: {ip}:5555")
-                        except Exception as adb_e:
-                            pass
-                except:
-                    pass
-            if found_ips:
-                self.ip_input.setText(found_ips[0])
-                self.log(f"🟢📱🌐 Scan done: {', '.join(found_ips)}")
-            else:
-                self.log("⚠️📱🌐 No ADB devices found on network")
-        threading.Thread(target=scan, daemon=True).start()
+        if not self.checkbox_wireless.isChecked():
+            self.log("📶⚙️ Enable Wireless Mode to scan for devices.")
+            return
+        ip_base = subnet_base(self.ip_input.text())
+        self.log(f"🔍🌐📱 Scanning network: {ip_base}.0/24 ...")
+        self.start_worker(scan_subnet, ip_base, on_result=self.scan_done,
+                          on_error=lambda error: self.log(f"🚨🌐 Network scan failed: {error}"))
+
+    def scan_done(self, found_ips):
+        for ip in found_ips:
+            self.devices_data[f"{ip}:5555"] = {"status": "Online", "name": f"Device_{ip.rsplit('.', 1)[1]}", "last_status": "Online"}
+            self.log(f"✅📱 Found device: {ip}:5555")
+        if found_ips:
+            self.save_devices()
+            self.DeviceListUpdated.emit(self.devices, self.devices_data, self.device_id or "", f"{found_ips[0]}:5555")
+            self.ip_input.setText(found_ips[0])
+            self.log(f"🟢📱🌐 Scan done: {', '.join(found_ips)}")
+        else:
+            self.log("⚠️📱🌐 No ADB devices found on network")
 
     def detect_connection_mode(self):
         try:
-            self.ensure_adb_server()
-            result = subprocess.run(["adb", "devices"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            output = result.stdout.splitlines()
-            devices = []
-            for line in output:
-                if "\tdevice" in line or "\toffline" in line:
-                    parts = line.split("\t")
-                    if len(parts) >= 2:
-                        device_id = parts[0]
-                        mode = "wireless" if ":" in device_id else "usb"
-                        devices.append((device_id, mode))
-            return devices
+            return parse_adb_devices(adb_host("host:devices"))
         except Exception as e:
             self.log(f"🚨📱🔌Error checking ADB devices: {str(e)}")
-            return []
+            return {}
+
+    def device_online(self, device_id):
+        return self.device_shell(device_id, "echo test").strip() == "test"
+
+    def device_shell(self, device_id, command, timeout=2):
+        session = self.adb_sessions.setdefault(device_id, AdbSession(device_id))
+        return session.run(command, timeout)
 
     def quick_reconnect(self):
         if not self.checkbox_wireless.isChecked():
@@ -602,9 +821,8 @@ class CyberScrcpy(QWidget):
             return
         def reconnect_all():
             self.log("🔄🦉 Starting quick reconnect for all wireless devices...")
-            self.ensure_adb_server()
             devices = self.detect_connection_mode()
-            for device_id, mode in devices:
+            for device_id, mode in devices.items():
                 if mode == "usb":
                     if self.last_status.get(device_id) != "Skipped":
                         self.log(f"🚫 Skipping USB-only device: {device_id}")
@@ -624,8 +842,8 @@ class CyberScrcpy(QWidget):
                         self.last_reconnect_time[device_id] = time.time()
                         self.log(f"🔄 Attempting reconnect to {device_id} (Attempt {self.reconnect_attempts[device_id]}/3)")
                         try:
-                            connect_result = subprocess.check_output(["adb", "connect", device_id], stderr=subprocess.STDOUT, text=True, timeout=4)
-                            if "connected" in connect_result.lower() or "already connected" in connect_result.lower():
+                            connect_result = adb_host(f"host:connect:{device_id}", timeout=4)
+                            if connect_ok(connect_result):
                                 data["status"] = "Online"
                                 self.reconnect_attempts[device_id] = 0
                                 self.last_status[device_id] = "Online"
@@ -642,71 +860,139 @@ class CyberScrcpy(QWidget):
             self.log("🟢 Quick reconnect completed")
         threading.Thread(target=reconnect_all, daemon=True).start()
 
+    def start_worker(self, fn, *args, on_result=None, on_error=None):
+        worker = AdbWorker(fn, *args)
+        if on_result:
+            worker.signals.result.connect(on_result)
+        if on_error:
+            worker.signals.error.connect(on_error)
+        QThreadPool.globalInstance().start(worker)
+
     def update_device_list_safely(self):
+        # Skip the tick if the previous poll is still waiting on adb
+        if self.device_poll_running:
+            self.device_poll_pending = True
+            return
+        self.device_poll_running = True
+        self.start_worker(self.poll_devices, on_result=self.apply_device_poll, on_error=self.device_poll_done)
+
+    def device_poll_done(self, changed=True):
+        self.device_poll_running = False
+        if self.device_poll_pending:
+            self.device_poll_pending = False
+            self.update_device_list_safely()
+        if changed is not False:
+            self.reset_device_poll()
+            return
+        # Nothing moved: stretch the interval after a few quiet ticks
+        self.idle_polls += 1
+        if self.idle_polls >= DEVICE_POLL_IDLE_TICKS:
+            self.idle_polls = 0
+            self.device_timer.setInterval(min(DEVICE_POLL_MAX_INTERVAL, self.device_timer.interval() * 2))
+
+    def track_devices(self):
+        while not self.closing:
+            try:
+                with adb_server_socket(2) as sock:
+                    adb_send(sock, "host:track-devices")
+                    sock.settimeout(None)
+                    self.track_socket = sock
+                    while True:
+                        self.DevicesChanged.emit(recv_exact(sock, int(recv_exact(sock, 4), 16)).decode())
+            except (OSError, RuntimeError, ValueError):
+                self.track_socket = None
+                if not self.closing:
+                    time.sleep(TRACK_RETRY_DELAY)
+
+    def on_devices_changed(self, payload):
+        self.devices = parse_adb_devices(payload)
+        self.reset_device_poll()
+        self.update_device_list_safely()
+
+    def reset_device_poll(self):
+        self.idle_polls = 0
+        if self.device_timer.interval() != DEVICE_POLL_INTERVAL:
+            self.device_timer.setInterval(DEVICE_POLL_INTERVAL)
+
+    def poll_devices(self):
+        # Runs on the pool: only probe here, devices_data is updated on the GUI thread
+        devices = self.detect_connection_mode()
+        with self.devices_lock:
+            ips = [ip for ip in self.devices_data if ":" in ip]
+        statuses = {}
+        for ip in ips:
+            try:
+                statuses[ip] = "Online" if self.device_online(ip) else "Offline"
+            except Exception:
+                statuses[ip] = "Offline"
+        return devices, statuses
+
+    def apply_device_poll(self, result):
+        devices, statuses = result
         try:
-            self.devices = self.detect_connection_mode()
-            for ip, data in self.devices_data.items():
+            self.devices = devices
+            for ip, data in list(self.devices_data.items()):
                 if ":" not in ip:
                     if self.last_status.get(ip) != "Skipped":
                         self.log(f"🚫 Skipping USB-only device: {ip}")
                         self.last_status[ip] = "Skipped"
                     continue
-                try:
-                    result = subprocess.run(["adb", "-s", ip, "shell", "echo", "test"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=2)
-                    new_status = "Online" if result.returncode == 0 and result.stdout.strip() == "test" else "Offline"
-                    if new_status != data.get("status"):
-                        data["status"] = new_status
-                        self.last_status[ip] = new_status
-                        self.log(f"{'🟢' if new_status == 'Online' else '🔴'} Device {ip}: {new_status}")
-                    if new_status == "Offline":
-                        self.attempt_reconnect(ip, data)
-                except Exception:
-                    if data.get("status") != "Offline":
-                        data["status"] = "Offline"
-                        self.last_status[ip] = "Offline"
-                        self.log(f"🔴 Device {ip}: Offline")
-                        self.attempt_reconnect(ip, data)
+                new_status = statuses.get(ip)
+                if new_status is None:
+                    continue  # Added while the poll was running; the next one picks it up
+                if new_status != data.get("status"):
+                    data["status"] = new_status
+                    self.last_status[ip] = new_status
+                    self.log(f"{'🟢' if new_status == 'Online' else '🔴'} Device {ip}: {new_status}")
+                if new_status == "Offline":
+                    self.attempt_reconnect(ip, data)
+            fingerprint = hash((tuple(self.devices.items()), tuple((ip, data.get("status")) for ip, data in self.devices_data.items())))
+            if fingerprint == self.devices_fingerprint:
+                self.device_poll_done(False)
+                return
+            self.devices_fingerprint = fingerprint
             self.DeviceListUpdated.emit(self.devices, self.devices_data, self.device_id or "", "")
             self.save_devices()
         except Exception as e:
             self.log(f"🚨📲🧩 Error updating device list: {str(e)}")
+        self.device_poll_done()
 
     def update_device_selection(self):
+        self.reset_device_poll()
         try:
-            if self.device_combo.currentIndex() == 0 or not self.devices:
+            ip = self.device_combo.currentData()
+            if not ip:
                 self.device_id = None
                 self.ip_input.clear()
                 self.toggle_ip_input()
                 self.status_label.setText("📱🔌❌ Disconnected")
                 return
-            selected_text = self.device_combo.currentText()
-            for ip, data in self.devices_data.items():
-                name = data.get("name", ip.split(":")[0])
-                display = f"{name} ({ip})" if name else f"{ip}"
-                if display == selected_text or f"{ip} (usb)" == selected_text or f"{ip} (wireless)" == selected_text:
-                    self.device_id = ip
-                    self.ip_input.setText(ip.split(":")[0] if ":" in ip else ip)
-                    try:
-                        result = subprocess.run(["adb", "-s", ip, "shell", "echo", "test"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=2)
-                        new_status = "Online" if result.returncode == 0 and result.stdout.strip() == "test" else "Offline"
-                        if new_status != data.get("status"):
-                            data["status"] = new_status
-                            self.last_status[ip] = new_status
-                            self.log(f"{'🟢' if new_status == 'Online' else '🔴'} Device {ip}: {new_status}")
-                        status_text = f"🟢📱🔌 Connected ({'Wireless' if ':' in ip else 'USB'})" if new_status == "Online" else "🔴📱🔌 Offline"
-                        self.status_label.setText(status_text)
-                    except Exception as e:
-                        if data.get("status") != "Offline":
-                            data["status"] = "Offline"
-                            self.last_status[ip] = "Offline"
-                            self.log(f"🔴 Device {ip}: Offline - {str(e)}")
-                        self.status_label.setText("🔴📱🔌 Offline")
-                    break
+            # Combo rebuilds re-select the same device; don't re-check it right away
+            if ip != self.device_id or time.monotonic() - self.device_checked_at.get(ip, 0) >= DEVICE_CHECK_TTL:
+                self.start_worker(self.device_online, ip,
+                                  on_result=lambda online: self.show_device_status(ip, online),
+                                  on_error=lambda error: self.show_device_status(ip, False, error))
+            self.device_id = ip
+            self.ip_input.setText(ip.split(":")[0] if ":" in ip else ip)
             self.toggle_ip_input()
             self.save_devices()
         except Exception as e:
             self.log(f"⚠️🚨 Error updating device selection: {str(e)}")
 
+    def show_device_status(self, ip, online, error=""):
+        self.device_checked_at[ip] = time.monotonic()
+        data = self.devices_data.get(ip)
+        if data is None:
+            return
+        new_status = "Online" if online else "Offline"
+        if new_status != data.get("status"):
+            data["status"] = new_status
+            self.last_status[ip] = new_status
+            self.log(f"{'🟢' if online else '🔴'} Device {ip}: {new_status}{f' - {error}' if error else ''}")
+        if ip == self.device_id:
+            status_text = f"🟢📱🔌 Connected ({'Wireless' if ':' in ip else 'USB'})" if online else "🔴📱🔌 Offline"
+            self.status_label.setText(status_text)
+
     def wifi_connect(self):
         ip = self.ip_input.text().strip()
         if not ip:
@@ -716,43 +1002,63 @@ class CyberScrcpy(QWidget):
             ip_full = f"{ip}:5555"
         else:
             ip_full = ip
-        try:
-            self.log(f"🔌 Running: adb connect {ip_full}")
-            result = subprocess.check_output(["adb", "connect", ip_full], stderr=subprocess.STDOUT, universal_newlines=True, timeout=5)
-            self.log(result)
-            if "connected" in result.lower() or "already connected" in result.lower():
-                self.device_combo.addItem(f"{ip_full} (wireless)")
-                self.status_label.setText("🟢📶 Connected (Wireless)")
-                self.devices_data[ip_full] = {"status": "Online", "name": ip, "last_status": "Online"}
-                self.save_devices()
-            else:
-                self.log(f"⚠️📱🔌 Offline device: {ip_full}")
-                self.status_label.setText("🔴📱🔌 Disconnected")
-        except subprocess.CalledProcessError as e:
-            self.log(f"🔴📱🔌 Offline device: {ip_full} - {e.output}")
-            self.status_label.setText("🔴📱🔌 Disconnected")
-        except Exception as e:
-            self.log(f"🚨 Unexpected error during WiFi connect: {str(e)}")
+        self.log(f"🔌 Running: adb connect {ip_full}")
+        self.reset_device_poll()
+        self.start_worker(adb_host, f"host:connect:{ip_full}", 5,
+                          on_result=lambda result: self.wifi_connected(ip, ip_full, result),
+                          on_error=lambda error: self.wifi_failed(ip_full, error))
+
+    def wifi_connected(self, ip, ip_full, result):
+        self.log(result)
+        if connect_ok(result):
+            if self.device_combo.findData(ip_full) == -1:
+                self.device_combo.addItem(f"{ip_full} (wireless)", ip_full)
+            self.status_label.setText("🟢📶 Connected (Wireless)")
+            self.devices_data[ip_full] = {"status": "Online", "name": ip, "last_status": "Online"}
+            self.save_devices()
+        else:
+            self.log(f"⚠️📱🔌 Offline device: {ip_full}")
             self.status_label.setText("🔴📱🔌 Disconnected")
 
+    def wifi_failed(self, ip_full, error):
+        self.log(f"🔴📱🔌 Offline device: {ip_full} - {error}")
+        self.status_label.setText("🔴📱🔌 Disconnected")
+
+    def scrcpy_option_args(self):
+        args = []
+        if self.checkbox_fullscreen.isChecked():
+            args.append("--fullscreen")
+        bit_rate = self.bit_rate_input.text()
+        if bit_rate:
+            args += ["--video-bit-rate", bit_rate]
+        max_size = self.max_size_input.text()
+        if max_size:
+            args += ["--max-size", max_size]
+        try:
+            custom_args = split_args(self.custom_options_input.text())
+        except ValueError as e:
+            self.log(f"⚠️🚨 Invalid custom scrcpy options ignored: {str(e)}")
+            return args
+        if all(SCRCPY_ARG_RE.match(arg) for arg in custom_args):
+            return args + custom_args
+        self.log("⚠️🚨 Invalid custom scrcpy options ignored")
+        return args + [arg for arg in custom_args if SCRCPY_ARG_RE.match(arg)]
+
     def launch_all_devices(self):
-        if not self.scrcpy_path or not os.path.exists(self.scrcpy_path):
+        if not self.scrcpy_path_valid:
             self.log("🚨🥷🔒 scrcpy.exe not found. Use 'Locate scrcpy.exe' first.")
             return
 
-        if not os.path.exists(DEVICES_FILE):
-            self.log(f"🚨📱🔒 {DEVICES_FILE} not found in the current directory.")
+        # devices_data is what save_devices keeps on disk, so no need to re-read the file
+        device_data = dict(self.devices_data)
+        if not device_data:
+            self.log("🚨📱🔒 No devices listed in devices.json.")
             return
 
-        try:
-            with open(DEVICES_FILE, "r") as f:
-                device_data = json.load(f)
-                if not device_data:
-                    self.log("🚨📱🔒 No devices listed in devices.json.")
-                    return
-        except Exception as e:
-            self.log(f"🚨📱🔒 Error loading devices.json: {str(e)}")
-            return
+        # Same flags for every device: read the widgets once, on the GUI thread
+        common_args = self.scrcpy_option_args()
+        record = self.checkbox_record.isChecked()
+        wireless = self.checkbox_wireless.isChecked()
 
         def launch_device(device_id, data):
             if not (":" in device_id or device_id.replace(".", "").isdigit()):
@@ -761,8 +1067,7 @@ class CyberScrcpy(QWidget):
                 return
 
             try:
-                result = subprocess.run(["adb", "-s", device_id, "shell", "echo", "test"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=2)
-                if result.returncode != 0 or result.stdout.strip() != "test":
+                if not self.device_online(device_id):
                     if self.last_status.get(device_id) != "Offline":
                         self.log(f"⚠️📱🔌 Offline device: {device_id}")
                         self.last_status[device_id] = "Offline"
@@ -775,29 +1080,19 @@ class CyberScrcpy(QWidget):
                 data["status"] = "Offline"
                 return
 
-            args = [self.scrcpy_path, "-s", device_id]
-            if self.checkbox_fullscreen.isChecked():
-                args.append("--fullscreen")
-            if self.checkbox_record.isChecked():
-                record_path = f"{device_id.replace(':', '_')}_{self.record_path}"
-                args += ["--record", record_path]
-            if self.bit_rate_input.text():
-                args += ["--video-bit-rate", self.bit_rate_input.text()]
-            if self.max_size_input.text():
-                args += ["--max-size", self.max_size_input.text()]
-            if self.custom_options_input.text():
-                custom_args = self.custom_options_input.text().strip().split()
-                valid_args = [arg for arg in custom_args if arg.startswith("--") or arg.isalnum() or "=" in arg]
-                if len(valid_args) != len(custom_args):
-                    self.log(f"⚠️🚨 Invalid custom scrcpy options ignored for {device_id}")
-                args.extend(valid_args)
-
-            if ":" in device_id and self.checkbox_wireless.isChecked():
+            args = [self.scrcpy_path, "-s", device_id, *common_args]
+            if record:
+                args += ["--record", f"{device_id.replace(':', '_')}_{self.record_path}"]
+
+            if ":" in device_id and wireless:
                 try:
                     self.log(f"Ensuring {device_id} is in TCP/IP mode...")
-                    subprocess.run(["adb", "tcpip", "5555"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=5)
+                    try:
+                        adb_device(device_id, "tcpip:5555")
+                    except RuntimeError:
+                        pass  # The connect below reports whether the device is reachable
                     time.sleep(1)
-                    connect_result = subprocess.check_output(["adb", "connect", device_id], stderr=subprocess.STDOUT, timeout=5, text=True)
+                    connect_result = adb_host(f"host:connect:{device_id}", timeout=5)
                     if "cannot connect" in connect_result.lower():
                         self.log(f"🚨 Failed to connect to {device_id}: {connect_result.strip()}")
                         data["status"] = "Offline"
@@ -808,7 +1103,7 @@ class CyberScrcpy(QWidget):
                     return
 
             try:
-                subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **SCRCPY_POPEN_ARGS)
                 self.log(f"🚀🥷🔓 scrcpy launched for device {device_id}")
                 data["status"] = "Online"
                 self.last_status[device_id] = "Online"
@@ -822,79 +1117,26 @@ class CyberScrcpy(QWidget):
             threading.Thread(target=launch_device, args=(device_id, data), daemon=True).start()
         QTimer.singleShot(1000, self.update_device_list_safely)
 
-    def setup_adb(self):
-        if not self.device_combo.currentIndex() or self.device_combo.currentIndex() == 0 or not self.devices:
-            self.log("⚠️📱🔌 Invalid device selection")
-            self.status_label.setText("🔴📱🔌 Disconnected")
-            return False, None
-
-        try:
-            device_id, mode = self.devices[self.device_combo.currentIndex() - 1]
-            self.log(f"📲🔌⚡️ Selected device: {device_id} ({mode})")
-        except IndexError:
-            self.log("⚠️📱🔌 Invalid device selection")
-            self.status_label.setText("🔴📱🔌 Disconnected")
-            return False, None
-
-        self.status_label.setText("⏳Connecting...")
-        if self.status_gif:
-            self.status_gif.start()
-
-        try:
-            result = subprocess.run(["adb", "-s", device_id, "shell", "echo", "test"],
-                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=2)
-            if result.returncode == 0 and result.stdout.strip() == "test":
-                self.log(f"✅🔌🔓 {'USB' if mode == 'usb' else 'Wireless'} ADB connected")
-                self.status_label.setText(f"🟢🔌🔋 Connected ({'USB' if mode == 'usb' else 'Wireless'})")
-                if self.status_gif:
-                    self.status_gif.stop()
-                if device_id in self.devices_data:
-                    self.devices_data[device_id]["status"] = "Online"
-                    self.last_status[device_id] = "Online"
-                return True, device_id
-            else:
-                if self.last_status.get(device_id) != "Offline":
-                    self.log(f"🚨🔌 Device not responding: {result.stderr}")
-                    self.last_status[device_id] = "Offline"
-                self.status_label.setText("🔴📱🔌 Offline")
-                if device_id in self.devices_data:
-                    self.devices_data[device_id]["status"] = "Offline"
-        except Exception as e:
-            if self.last_status.get(device_id) != "Offline":
-                self.log(f"🚨🔌 Connection error: {str(e)}")
-                self.last_status[device_id] = "Offline"
-            self.status_label.setText("🔴📱🔌 Offline")
-            if device_id in self.devices_data:
-                self.devices_data[device_id]["status"] = "Offline"
-        if self.status_gif:
-            self.status_gif.stop()
-        return False, None
-
     def launch_selected_device(self):
-        if not self.scrcpy_path or not os.path.exists(self.scrcpy_path):
+        if not self.scrcpy_path_valid:
             self.log("🚨⚠️🔒 scrcpy.exe not found. Use 'Locate scrcpy.exe' first.")
             self.status_label.setText("🔴📱🔌 Disconnected")
             return
 
-        device = self.device_combo.currentText().split()[0]
-        if not device or device == "Select":
+        device = self.device_combo.currentData()
+        if not device:
             self.log("⚠️📱🔌 No device selected")
             self.status_label.setText("🔴📱🔌 Disconnected")
             return
 
-        try:
-            result = subprocess.run(["adb", "-s", device, "shell", "echo", "test"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=2)
-            if result.returncode != 0 or result.stdout.strip() != "test":
-                if self.last_status.get(device) != "Offline":
-                    self.log(f"🔴📱🔌 Offline device: {device}")
-                    self.last_status[device] = "Offline"
-                self.status_label.setText("🔴📱🔌 Offline")
-                if device in self.devices_data:
-                    self.devices_data[device]["status"] = "Offline"
-                return
-        except Exception as e:
+        self.start_worker(self.device_online, device,
+                          on_result=lambda online: self.launch_if_online(device, online),
+                          on_error=lambda error: self.launch_if_online(device, False, error))
+
+    def launch_if_online(self, device, online, error=""):
+        if not online:
             if self.last_status.get(device) != "Offline":
-                self.log(f"🚨📱🔌 Error checking device status: {str(e)}")
+                self.log(f"🚨📱🔌 Error checking device status: {error}" if error else f"🔴📱🔌 Offline device: {device}")
                 self.last_status[device] = "Offline"
             self.status_label.setText("🔴📱🔌 Offline")
             if device in self.devices_data:
@@ -902,83 +1144,109 @@ class CyberScrcpy(QWidget):
             return
 
         self.status_label.setText("✅ Launching scrcpy...")
-        def _launch():
-            try:
-                args = [self.scrcpy_path, "-s", device]
-                if self.checkbox_fullscreen.isChecked():
-                    args.append("--fullscreen")
-                if self.checkbox_record.isChecked():
-                    args += ["--record", self.record_path]
-                if self.bit_rate_input.text():
-                    args += ["--video-bit-rate", self.bit_rate_input.text()]
-                if self.max_size_input.text():
-                    args += ["--max-size", self.max_size_input.text()]
-                if self.custom_options_input.text():
-                    custom_args = self.custom_options_input.text().strip().split()
-                    valid_args = [arg for arg in custom_args if arg.startswith("--") or arg.isalnum() or "=" in arg]
-                    if len(valid_args) != len(custom_args):
-                        self.log("⚠️ Invalid custom scrcpy options ignored")
-                    args.extend(valid_args)
-
-                self.scrcpy_process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                if device in self.devices_data:
-                    self.devices_data[device]["status"] = "Online"
-                    self.last_status[device] = "Online"
-                self.status_label.setText(f"🟢 Connected to: {device}")
-                self.log(f"✅🥷🔓 scrcpy launched successfully for {device}")
-
-                while self.scrcpy_process.poll() is None:
-                    try:
-                        result = subprocess.run(["adb", "-s", device, "shell", "echo", "test"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=2)
-                        if result.returncode != 0 or result.stdout.strip() != "test":
-                            self.scrcpy_process.terminate()
-                            self.status_label.setText("🔴📱🔌 Offline")
-                            if self.last_status.get(device) != "Offline":
-                                self.log(f"🔴📱🔌 Device {device} disconnected during scrcpy")
-                                self.last_status[device] = "Offline"
-                            if device in self.devices_data:
-                                self.devices_data[device]["status"] = "Offline"
-                            break
-                    except Exception:
-                        self.scrcpy_process.terminate()
-                        self.status_label.setText("🔴📱🔌 Offline")
-                        if self.last_status.get(device) != "Offline":
-                            self.log(f"🔴📱🔌 Device {device} disconnected during scrcpy")
-                            self.last_status[device] = "Offline"
-                        if device in self.devices_data:
-                            self.devices_data[device]["status"] = "Offline"
-                        break
-                    time.sleep(1)
-                if self.scrcpy_process.poll() is not None:
-                    self.status_label.setText("🔴📱🔌 Disconnected")
-                    self.log(f"🔴📱🔌 scrcpy process for {device} ended")
-                    if device in self.devices_data:
-                        self.devices_data[device]["status"] = "Offline"
-                        self.last_status[device] = "Offline"
-                    self.scrcpy_process = None
-            except Exception as e:
-                self.status_label.setText(f"🔴📱🔌 Disconnected")
-                self.log(f"🚨☠️ Error launching scrcpy for {device}: {str(e)}")
-                if device in self.devices_data:
-                    self.devices_data[device]["status"] = "Offline"
-                    self.last_status[device] = "Offline"
-                self.scrcpy_process = None
+        args = [self.scrcpy_path, "-s", device, *self.scrcpy_option_args()]
+        if self.checkbox_record.isChecked():
+            args += ["--record", self.record_path]
+        try:
+            process = self.start_scrcpy_process(args, lambda process: self.scrcpy_finished(process, device), quiet=True)
+        except OSError as e:
+            self.status_label.setText(f"🔴📱🔌 Disconnected")
+            self.log(f"🚨☠️ Error launching scrcpy for {device}: {str(e)}")
+            if device in self.devices_data:
+                self.devices_data[device]["status"] = "Offline"
+                self.last_status[device] = "Offline"
+            return
+        self.scrcpy_process = process
+        if device in self.devices_data:
+            self.devices_data[device]["status"] = "Online"
+            self.last_status[device] = "Online"
+        self.status_label.setText(f"🟢 Connected to: {device}")
+        self.log(f"✅🥷🔓 scrcpy launched successfully for {device}")
+
+        watch = QTimer(process)
+        watch.setSingleShot(True)
+        watch.setInterval(SCRCPY_WATCH_INTERVAL)
+        watch.timeout.connect(lambda: self.check_scrcpy_device(process, device, watch))
+        watch.start()
+
+    def start_scrcpy_process(self, args, on_finished, quiet=False):
+        # QProcess reports the exit through the event loop, no waiting thread needed
+        process = QProcess(self)
+        if quiet:
+            process.setStandardOutputFile(QProcess.nullDevice())
+            process.setStandardErrorFile(QProcess.nullDevice())
+        else:
+            process.setProcessChannelMode(QProcess.ForwardedChannels)
+        process.finished.connect(lambda *_: on_finished(process))
+        process.start(args[0], args[1:])
+        if not process.waitForStarted():
+            error = process.errorString()
+            process.deleteLater()
+            raise OSError(error)
+        return process
+
+    def scrcpy_running(self):
+        return self.scrcpy_process is not None and self.scrcpy_process.state() != QProcess.NotRunning
+
+    def stop_scrcpy(self):
+        process = self.scrcpy_process
+        self.scrcpy_process = None
+        if process is not None and process.state() != QProcess.NotRunning:
+            # Same as Ctrl+C in a terminal, which is the stop scrcpy finalizes recordings on
+            if os.name == "posix":
+                os.kill(process.processId(), signal.SIGINT)
+            else:
+                process.terminate()
+            kill_timer = QTimer(process)
+            kill_timer.setSingleShot(True)
+            kill_timer.timeout.connect(process.kill)
+            kill_timer.start(SCRCPY_STOP_TIMEOUT)
+        return process
+
+    def check_scrcpy_device(self, process, device, watch):
+        if process is not self.scrcpy_process:
+            return
+        self.start_worker(self.device_online, device,
+                          on_result=lambda online: self.scrcpy_device_checked(process, device, watch, online),
+                          on_error=lambda error: self.scrcpy_device_checked(process, device, watch, False))
 
-        threading.Thread(target=_launch, daemon=True).start()
+    def scrcpy_device_checked(self, process, device, watch, online):
+        if process is not self.scrcpy_process:
+            return
+        if online:
+            watch.start()
+            return
+        self.stop_scrcpy()
+        self.status_label.setText("🔴📱🔌 Offline")
+        if self.last_status.get(device) != "Offline":
+            self.log(f"🔴📱🔌 Device {device} disconnected during scrcpy")
+            self.last_status[device] = "Offline"
+        if device in self.devices_data:
+            self.devices_data[device]["status"] = "Offline"
+
+    def scrcpy_finished(self, process, device):
+        process.deleteLater()
+        if process is not self.scrcpy_process:
+            return
+        self.scrcpy_process = None
+        self.status_label.setText("🔴📱🔌 Disconnected")
+        self.log(f"🔴📱🔌 scrcpy process for {device} ended")
+        if device in self.devices_data:
+            self.devices_data[device]["status"] = "Offline"
+            self.last_status[device] = "Offline"
 
     def start_recording(self):
         if not self.device_id:
             self.log("🚨📲🔒 No device selected")
             return
-        if self.scrcpy_process and self.scrcpy_process.poll() is None:
+        if self.scrcpy_running():
             self.log("⚡️🟢🎬 scrcpy already running; stop current session to start recording")
             return
 
         args = [self.scrcpy_path, "-s", self.device_id, "--record", self.record_path]
         try:
-            self.scrcpy_process = subprocess.Popen(args)
-            self.btn_start_record.setEnabled(False)
-            self.btn_stop_record.setEnabled(True)
+            self.scrcpy_process = self.start_scrcpy_process(args, self.recording_exited)
+            self.set_recording_state(True)
             self.log("✅🎥🎬 Recording started")
             if self.device_id in self.devices_data:
                 self.devices_data[self.device_id]["status"] = "Online"
@@ -989,12 +1257,22 @@ class CyberScrcpy(QWidget):
                 self.devices_data[self.device_id]["status"] = "Offline"
                 self.last_status[self.device_id] = "Offline"
 
+    def set_recording_state(self, recording):
+        self.btn_start_record.setEnabled(not recording)
+        self.btn_stop_record.setEnabled(recording)
+
+    def recording_exited(self, process):
+        process.deleteLater()
+        if process is not self.scrcpy_process:
+            return
+        self.scrcpy_process = None
+        self.set_recording_state(False)
+        self.log(f"⏹️🔴 scrcpy recording ended (exit code {process.exitCode()})")
+
     def stop_recording(self):
-        if self.scrcpy_process and self.scrcpy_process.poll() is None:
-            self.scrcpy_process.terminate()
-            self.scrcpy_process = None
-            self.btn_start_record.setEnabled(True)
-            self.btn_stop_record.setEnabled(False)
+        if self.scrcpy_running():
+            self.stop_scrcpy()
+            self.set_recording_state(False)
             self.log("⏹️🛑 Recording stopped")
             if self.device_id in self.devices_data:
                 self.devices_data[self.device_id]["status"] = "Offline"
@@ -1008,38 +1286,77 @@ class CyberScrcpy(QWidget):
             self.log("⚠️🚨 No ADB command provided")
             return
 
-        dangerous_commands = ["reboot", "fastboot", "recovery", "bootloader"]
-        if any(cmd in command.lower() for cmd in dangerous_commands):
+        if DANGEROUS_RE.search(command):
             self.log("🛑💀🚨 Blocked dangerous command: reboot-related commands are disabled")
             return
 
         try:
-            args = ["adb"] + (["-s", self.device_id] if self.device_id else []) + command.split()
-            result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=5)
-            if result.stdout:
-                self.log(f"✅🤖 ADB output: {result.stdout}")
-            if result.stderr:
-                self.log(f"⚠️🚨 ADB error: {result.stderr}")
-        except Exception as e:
-            self.log(f"🚨⚠️ Error executing ADB command: {str(e)}")
+            tokens = split_adb_command(command)
+        except ValueError as e:
+            self.log(f"⚠️🚨 Could not parse ADB command: {str(e)}")
+            return
+        args = (["-s", self.device_id] if self.device_id else []) + tokens
+        process = QProcess(self)
+        # Stream output into the log as adb produces it
+        process.readyReadStandardOutput.connect(lambda: self.show_adb_output(process))
+        process.readyReadStandardError.connect(lambda: self.show_adb_output(process))
+        process.finished.connect(lambda *_: self.adb_command_finished(process))
+        process.errorOccurred.connect(lambda error: self.adb_command_failed(process, error))
+        timeout = QTimer(process)
+        timeout.setSingleShot(True)
+        timeout.timeout.connect(process.kill)
+        timeout.start(ADB_COMMAND_TIMEOUT)
+        process.start("adb", args)
+
+    def show_adb_output(self, process):
+        stdout = bytes(process.readAllStandardOutput()).decode(errors="replace")
+        stderr = bytes(process.readAllStandardError()).decode(errors="replace")
+        if stdout:
+            self.log(f"✅🤖 ADB output: {stdout}")
+        if stderr:
+            self.log(f"⚠️🚨 ADB error: {stderr}")
+
+    def adb_command_finished(self, process):
+        self.show_adb_output(process)
+        process.deleteLater()
+
+    def adb_command_failed(self, process, error):
+        self.log(f"🚨⚠️ Error executing ADB command: {process.errorString()}")
+        # A process that never started will not emit finished
+        if error == QProcess.FailedToStart:
+            process.deleteLater()
 
     def manage_devices(self):
-        dialog = DeviceManagerDialog(self, self.devices_data, self.update_device_list_safely)
-        dialog.exec_()
+        # Built on first use and kept; it edits devices_data in place
+        if self.device_manager is None:
+            self.device_manager = DeviceManagerDialog(self, self.devices_data, self.update_device_list_safely)
+        else:
+            self.device_manager.update_table()
+        self.device_manager.exec_()
 
     def closeEvent(self, event):
-        if self.scrcpy_process and self.scrcpy_process.poll() is None:
-            self.scrcpy_process.terminate()
-            self.scrcpy_process = None
+        if self.scrcpy_running():
+            process = self.stop_scrcpy()
+            if not process.waitForFinished(SCRCPY_STOP_TIMEOUT):
+                process.kill()
         self.status_label.setText("🔴📱🔌 Disconnected")
         if self.device_id in self.devices_data:
             self.devices_data[self.device_id]["status"] = "Offline"
             self.last_status[self.device_id] = "Offline"
         self.save_devices()
+        for session in self.adb_sessions.values():
+            session.close()
+        self.closing = True
+        if self.track_socket:
+            try:
+                self.track_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
         super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_QSS)
     window = CyberScrcpy()
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file